@@ -3,13 +3,15 @@
 
 기존 CSV를 읽어 마지막 날짜 이후분만 증분 수집 후 병합 저장합니다.
 수집 실패 시 기존 데이터는 그대로 보존됩니다.
+KOFIA 와 investing.com 수집은 별도 스레드에서 동시에 진행됩니다.
 
 저장 경로:
   data/global_treasury.csv   — investing.com 글로벌 국채 (5년치)
   data/bond_summary.csv      — KOFIA 전종목 최종호가수익률 (5년치)
 
 사용법:
-    python collect_data.py
+    python collect_data.py                 # 전체
+    python collect_data.py kofia_bond      # 일부만 (SOURCES 키: kofia_bond / investing_gt / kofia_otc)
 
 완료 후 git push:
     git add data/
@@ -18,6 +20,8 @@
 """
 
 import sys
+import asyncio
+import numpy as np
 import pandas as pd
 from datetime import date, timedelta
 from pathlib import Path
@@ -42,9 +46,6 @@ end_date   = date.today() - timedelta(days=1)
 end_str    = end_date.strftime("%Y-%m-%d")
 target_str = end_date.strftime("%Y%m%d")
 
-print(f"[기준일] {end_str}")
-print()
-
 
 # ─── 헬퍼 ─────────────────────────────────────────────────────────────────────
 
@@ -53,7 +54,10 @@ def _load_csv(path: Path) -> pd.DataFrame | None:
     if not path.exists():
         return None
     try:
-        df = pd.read_csv(path, index_col="Date", parse_dates=True)
+        df = pd.read_csv(
+            path, index_col="Date", parse_dates=["Date"],
+            date_format="%Y-%m-%d", cache_dates=True,
+        )
         return df
     except Exception as e:
         print(f"  [읽기 오류] {path.name}: {e}")
@@ -67,145 +71,168 @@ def _last_date(df: pd.DataFrame | None) -> date | None:
     return df.index.max().date()
 
 
+def _start_date(existing: pd.DataFrame | None) -> date:
+    """증분 수집 시작일 — 기존 데이터가 없으면 5년 전부터 수집합니다."""
+    last = _last_date(existing)
+    if last:
+        return last + timedelta(days=1)
+    try:
+        return end_date.replace(year=end_date.year - 5)
+    except ValueError:
+        return end_date - timedelta(days=365 * 5)
+
+
 def _merge_save(existing: pd.DataFrame | None, new_df: pd.DataFrame, path: Path) -> pd.DataFrame:
     """
     기존 DataFrame과 새 데이터를 병합하여 CSV로 저장합니다.
     중복 날짜는 새 데이터를 우선합니다.
+
+    두 DataFrame 모두 금리(float) 컬럼만 가지므로, pd.concat 대신 컬럼을 한 번 맞춘 뒤
+    np.vstack 으로 값을 한 번에 쌓습니다 (넓은 프레임에서 블록 통합 복사를 피함).
+
+    새 데이터가 모두 기존 마지막 날짜 이후이고 컬럼 구성이 같으면(일반적인 증분 수집)
+    파일 전체를 다시 쓰지 않고 새 행만 CSV 끝에 이어 씁니다.
+    새 데이터가 비었거나 병합 결과가 기존과 같으면 파일을 건드리지 않습니다.
     """
+    if new_df.empty and existing is not None:
+        return existing
     if existing is not None and not existing.empty:
-        merged = pd.concat([existing, new_df])
+        same_cols = existing.columns.equals(new_df.columns)
+        if same_cols:
+            cols, old, new = existing.columns, existing, new_df
+        else:
+            cols = existing.columns.union(new_df.columns, sort=False)
+            old  = existing.reindex(columns=cols)
+            new  = new_df.reindex(columns=cols)
+        merged = pd.DataFrame(
+            np.vstack([old.to_numpy(dtype=float), new.to_numpy(dtype=float)]),
+            index=old.index.append(new.index),
+            columns=cols,
+        )
+        merged.index.name = "Date"
         merged = merged[~merged.index.duplicated(keep="last")]
-        merged.sort_index(inplace=True)
+        if not merged.index.is_monotonic_increasing:
+            merged = merged.sort_index()
+
+        appendable = (
+            path.exists()
+            and same_cols
+            and new_df.index.min() > existing.index.max()
+        )
+        if appendable:
+            merged.iloc[len(existing):].to_csv(path, mode="a", header=False)
+            return merged
+        if path.exists() and merged.equals(existing):
+            return existing  # 재수집 결과가 기존과 동일 → 파일 재기록 생략
     else:
-        merged = new_df.sort_index()
+        merged = new_df if new_df.index.is_monotonic_increasing else new_df.sort_index()
     merged.to_csv(path)
     return merged
 
 
-# ══════════════════════════════════════════════════════════════════════════════
-# 1. KOFIA BondSummary
-# ══════════════════════════════════════════════════════════════════════════════
+def _print_header(title: str) -> None:
+    print("=" * 60)
+    print(title)
+    print("=" * 60)
 
-print("=" * 60)
-print("1. KOFIA BondSummary")
-print("=" * 60)
 
-bs_existing = _load_csv(BOND_SUMMARY_CSV)
-bs_last     = _last_date(bs_existing)
-
-if bs_last:
-    bs_start_dt = bs_last + timedelta(days=1)
-else:
-    try:
-        bs_start_dt = end_date.replace(year=end_date.year - 5)
-    except ValueError:
-        bs_start_dt = end_date - timedelta(days=365 * 5)
-
-bs_start_str = bs_start_dt.strftime("%Y-%m-%d")
-print(f"  기간: {bs_start_str} ~ {end_str}")
-print("  " + "-" * 40)
-
-if bs_start_dt > end_date:
-    print("  [완료] 이미 최신 데이터")
-else:
-    bs = BondSummary()
-    df_bond = bs.collect(start_date=bs_start_str, end_date=end_str)
-    if df_bond is not None:
-        try:
-            df_std = KofiaCalc.standardize_bond(df_bond)
-            merged = _merge_save(bs_existing, df_std, BOND_SUMMARY_CSV)
-            print(f"  [저장] → {BOND_SUMMARY_CSV}  ({len(merged)}행 {len(merged.columns)}열)")
-            print(merged.tail(3).to_string())
-        except Exception as e:
-            print(f"  [표준화 오류] {e}")
-    else:
+def _save_result(existing: pd.DataFrame | None, df_new: pd.DataFrame | None, path: Path, standardize=None) -> None:
+    """수집 결과를 (필요 시 표준화 후) 기존 CSV에 병합 저장합니다."""
+    if df_new is None:
         print("  [실패] 기존 데이터 유지")
-
-print()
-
-# ══════════════════════════════════════════════════════════════════════════════
-# 2. investing.com GlobalTreasury
-# ══════════════════════════════════════════════════════════════════════════════
-
-print("=" * 60)
-print("2. investing.com GlobalTreasury")
-print("=" * 60)
-
-gt_existing = _load_csv(GLOBAL_TREASURY_CSV)
-gt_last     = _last_date(gt_existing)
-
-if gt_last:
-    gt_start_dt = gt_last + timedelta(days=1)
-else:
+        return
+    if df_new.empty:
+        print("  [완료] 신규 행 없음")
+        return
     try:
-        gt_start_dt = end_date.replace(year=end_date.year - 5)
-    except ValueError:
-        gt_start_dt = end_date - timedelta(days=365 * 5)
-
-gt_start_str = gt_start_dt.strftime("%Y-%m-%d")
-print(f"  기간: {gt_start_str} ~ {end_str}")
-print("  " + "-" * 40)
-
-if gt_start_dt > end_date:
-    print("  [완료] 이미 최신 데이터")
-else:
-    gt = GlobalTreasury()
-    df_g = gt.collect(start_date=gt_start_str, end_date=end_str)
-    if df_g is not None:
-        merged = _merge_save(gt_existing, df_g, GLOBAL_TREASURY_CSV)
-        print(f"  [저장] → {GLOBAL_TREASURY_CSV}  ({len(merged)}행 {len(merged.columns)}열)")
+        df_std = standardize(df_new) if standardize else df_new
+        merged = _merge_save(existing, df_std, path)
+        print(f"  [저장] → {path}  ({len(merged)}행 {len(merged.columns)}열)")
         print(merged.tail(3).to_string())
-    else:
-        print("  [실패] 기존 데이터 유지")
+    except Exception as e:
+        print(f"  [{'표준화' if standardize else '저장'} 오류] {e}")
 
-print()
 
-# ══════════════════════════════════════════════════════════════════════════════
-# 3. KOFIA 장외거래대표수익률
-# ══════════════════════════════════════════════════════════════════════════════
+# ─── 수집 대상 ────────────────────────────────────────────────────────────────
+#
+# 이름: (제목, 수집기 클래스, 표준화 함수, 저장 경로)
+# 새 데이터 소스는 여기에 한 줄 추가하고, 같은 서버를 쓰면 _SOURCE_GROUPS 의 같은 그룹에 넣습니다.
 
-print("=" * 60)
-print("3. KOFIA 장외거래대표수익률")
-print("=" * 60)
+SOURCES: dict[str, tuple] = {
+    "kofia_bond":   ("1. KOFIA BondSummary",            BondSummary,     KofiaCalc.standardize_bond, BOND_SUMMARY_CSV),
+    "investing_gt": ("2. investing.com GlobalTreasury", GlobalTreasury,  None,                       GLOBAL_TREASURY_CSV),
+    "kofia_otc":    ("3. KOFIA 장외거래대표수익률",       BondSummary_OTC, KofiaCalc.standardize_otc,  OTC_SUMMARY_CSV),
+}
 
-otc_existing = _load_csv(OTC_SUMMARY_CSV)
-otc_last     = _last_date(otc_existing)
+# 그룹 내부는 한 스레드에서 순차 실행(같은 서버), 그룹끼리는 asyncio.to_thread 로 동시 실행
+_SOURCE_GROUPS: list[list[str]] = [
+    ["kofia_bond", "kofia_otc"],   # kofiabond.or.kr
+    ["investing_gt"],              # investing.com
+]
 
-if otc_last:
-    otc_start_dt = otc_last + timedelta(days=1)
-else:
-    try:
-        otc_start_dt = end_date.replace(year=end_date.year - 5)
-    except ValueError:
-        otc_start_dt = end_date - timedelta(days=365 * 5)
-
-otc_start_str = otc_start_dt.strftime("%Y-%m-%d")
-print(f"  기간: {otc_start_str} ~ {end_str}")
-print("  " + "-" * 40)
-
-if otc_start_dt > end_date:
-    print("  [완료] 이미 최신 데이터")
-else:
-    otc = BondSummary_OTC()
-    df_otc = otc.collect(start_date=otc_start_str, end_date=end_str)
-    if df_otc is not None:
-        try:
-            df_std = KofiaCalc.standardize_otc(df_otc)
-            merged = _merge_save(otc_existing, df_std, OTC_SUMMARY_CSV)
-            print(f"  [저장] → {OTC_SUMMARY_CSV}  ({len(merged)}행 {len(merged.columns)}열)")
-            print(merged.tail(3).to_string())
-        except Exception as e:
-            print(f"  [표준화 오류] {e}")
-    else:
-        print("  [실패] 기존 데이터 유지")
 
-print()
+# ─── 수집 (KOFIA / investing.com 동시 실행) ──────────────────────────────────
 
-# ─── 완료 안내 ────────────────────────────────────────────────────────────────
-print("=" * 60)
-print("수집 완료. 아래 명령어로 GitHub에 push하세요:")
-print()
-print(f'  git add data/')
-print(f'  git commit -m "데이터 업데이트 {target_str}"')
-print(f'  git push')
-print("=" * 60)
+async def main(sources: list[str] | None = None) -> None:
+    """
+    sources 에 지정된 데이터셋(기본: 전체)을 증분 수집 후 병합 저장합니다.
+
+    서로 다른 사이트는 I/O 대기 작업이므로 겹쳐 실행하고, 병합 저장은 수집이
+    모두 끝난 뒤 메인 스레드에서 처리합니다.
+    """
+    names = [n for n in SOURCES if sources is None or n in sources]
+
+    print(f"[기준일] {end_str}")
+    print()
+
+    existing = {n: _load_csv(SOURCES[n][3]) for n in names}
+    starts   = {n: _start_date(existing[n]) for n in names}
+    for n in names:
+        print(f"  {SOURCES[n][0]}  기간: {starts[n]} ~ {end_str}")
+    print()
+
+    def collect_group(group: list[str]) -> dict[str, pd.DataFrame | None]:
+        # 소스별로 예외를 잡아 None 으로 기록 → 한 소스 실패가 다른 소스 결과 저장을 막지 않음
+        results: dict[str, pd.DataFrame | None] = {}
+        for n in group:
+            if n in starts and starts[n] <= end_date:
+                try:
+                    collector = SOURCES[n][1]()
+                    results[n] = collector.collect(start_date=str(starts[n]), end_date=end_str)
+                except Exception as e:
+                    print(f"  [수집 오류] {SOURCES[n][0]}: {e}")
+                    results[n] = None
+        return results
+
+    collected: dict[str, pd.DataFrame | None] = {}
+    for part in await asyncio.gather(*(asyncio.to_thread(collect_group, g) for g in _SOURCE_GROUPS)):
+        collected.update(part)
+    print()
+
+    # ── 병합 저장 (메인 스레드) ───────────────────────────────────────────────
+
+    for n in names:
+        title, _, standardize, path = SOURCES[n]
+        _print_header(title)
+        if starts[n] > end_date:
+            print("  [완료] 이미 최신 데이터")
+        else:
+            _save_result(existing[n], collected.get(n), path, standardize)
+        print()
+
+    # ─── 완료 안내 ────────────────────────────────────────────────────────────
+    print("=" * 60)
+    print("수집 완료. 아래 명령어로 GitHub에 push하세요:")
+    print()
+    print(f'  git add data/')
+    print(f'  git commit -m "데이터 업데이트 {target_str}"')
+    print(f'  git push')
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    _args = sys.argv[1:]
+    _unknown = [a for a in _args if a not in SOURCES]
+    if _unknown:
+        sys.exit(f"알 수 없는 데이터셋: {_unknown}  (사용 가능: {list(SOURCES)})")
+    asyncio.run(main(_args or None))
@@ -4,7 +4,7 @@
 import os
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta, date
 
@@ -18,18 +18,87 @@ st.title("MMS(Macro Monitoring System)")
 COUNTRIES = ["KR", "US", "DE", "GB", "JP", "CN"]
 TENORS    = [2, 3, 5, 10, 20, 30]
 
+# 만기 라벨·국가별 컬럼명은 import 시 한 번만 조합
+TENOR_LABELS = [f"{t}Y" for t in TENORS]
+COUNTRY_COLS = {c: [f"{c}_{t}Y" for t in TENORS] for c in COUNTRIES}
+
 
 # ─── 데이터 로드 ──────────────────────────────────────────────────────────────
 
+DATA_DIR  = "data"
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
+
+def _as_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """수익률 컬럼을 float32로 축소 (소수점 3자리 데이터 → 메모리·연산량 절반)."""
+    num_cols = df.select_dtypes(include=["float64", "int64"]).columns
+    if len(num_cols):
+        df = df.astype({c: "float32" for c in num_cols})
+    return df
+
+
+def _read_parquet_cache(cache_path: str, min_mtime: float) -> pd.DataFrame | None:
+    """min_mtime 보다 새로운 parquet 캐시를 읽습니다. 없거나 오래됐거나 손상되었으면 None."""
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < min_mtime:
+        return None
+    try:
+        return _as_float32(pd.read_parquet(cache_path))
+    except Exception as e:
+        print(f"[캐시] {os.path.basename(cache_path)} 읽기 실패, 원본에서 재생성: {e}")
+        return None
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_path: str) -> None:
+    """임시 파일에 쓴 뒤 os.replace 로 교체 (동시 세션·중단 시에도 반쯤 쓰인 캐시를 남기지 않음)."""
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(tmp)
+        os.replace(tmp, cache_path)
+    except Exception as e:
+        print(f"[캐시] {os.path.basename(cache_path)} 저장 실패: {e}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+@st.cache_data(show_spinner=False)
+def _read_data_csv(name: str, mtime: float) -> pd.DataFrame:
+    """
+    data/{name}.csv 를 DatetimeIndex DataFrame으로 읽습니다.
+
+    CSV보다 새로운 data/cache/{name}.parquet 가 있으면 CSV 파싱 없이 캐시를 읽고,
+    없으면 CSV를 파싱한 뒤 캐시를 기록합니다 (프로세스 재시작 간 재사용).
+    mtime(CSV 수정 시각)을 캐시 키로 받아, 파일이 바뀌지 않는 한 rerun 시 디스크를 읽지 않습니다.
+    """
+    csv_path   = os.path.join(DATA_DIR, f"{name}.csv")
+    cache_path = os.path.join(CACHE_DIR, f"{name}.parquet")
+    df = _read_parquet_cache(cache_path, os.path.getmtime(csv_path))
+    if df is not None:
+        df.attrs["source_mtime"] = mtime
+        return df
+
+    # Arrow 멀티스레드 리더 + ISO 날짜 포맷 명시 (행별 날짜 포맷 추론 생략)
+    df = pd.read_csv(csv_path, engine="pyarrow")
+    first = df.columns[0]
+    df[first] = pd.to_datetime(df[first], format="%Y-%m-%d", cache=True)
+    df = df.set_index(first)
+    df.index.name = "Date"
+    # 기준일 조회는 searchsorted(이진 탐색)를 쓰므로 인덱스 정렬을 로드 시점에 보장
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    df = _as_float32(df)
+    _write_parquet_cache(df, cache_path)
+    df.attrs["source_mtime"] = mtime  # _data_key 용 원본 CSV 버전
+    return df
+
+
 def _load_global() -> pd.DataFrame | None:
     """data/global_treasury.csv 에서 글로벌 국채 데이터를 로드합니다."""
-    csv_path = os.path.join("data", "global_treasury.csv")
+    csv_path = os.path.join(DATA_DIR, "global_treasury.csv")
     if not os.path.exists(csv_path):
         return None
     try:
-        df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
-        df.index.name = "Date"
-        return df
+        return _read_data_csv("global_treasury", os.path.getmtime(csv_path))
     except Exception as e:
         print(f"[글로벌] 파일 읽기 오류: {e}")
         return None
@@ -37,13 +106,11 @@ def _load_global() -> pd.DataFrame | None:
 
 def _load_otc() -> pd.DataFrame | None:
     """data/otc_summary.csv 에서 장외거래대표수익률 데이터를 로드합니다."""
-    csv_path = os.path.join("data", "otc_summary.csv")
+    csv_path = os.path.join(DATA_DIR, "otc_summary.csv")
     if not os.path.exists(csv_path):
         return None
     try:
-        df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
-        df.index.name = "Date"
-        return df
+        return _read_data_csv("otc_summary", os.path.getmtime(csv_path))
     except Exception as e:
         print(f"[OTC] 파일 읽기 오류: {e}")
         return None
@@ -51,50 +118,72 @@ def _load_otc() -> pd.DataFrame | None:
 
 def _load_bond() -> pd.DataFrame | None:
     """data/bond_summary.csv 에서 국내 채권 데이터를 로드합니다."""
-    csv_path = os.path.join("data", "bond_summary.csv")
+    csv_path = os.path.join(DATA_DIR, "bond_summary.csv")
     if not os.path.exists(csv_path):
         return None
     try:
-        df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
-        df.index.name = "Date"
-        return df
+        return _read_data_csv("bond_summary", os.path.getmtime(csv_path))
     except Exception as e:
         print(f"[BondSummary] 파일 읽기 오류: {e}")
         return None
 
 
-# ─── 앱 시작 시 사전 계산 ────────────────────────────────────────────────────
-
-_global_df: pd.DataFrame | None = _load_global()
-_bond_df:   pd.DataFrame | None = _load_bond()
-_otc_df:    pd.DataFrame | None = _load_otc()
-
-# bond_summary의 KTB_nY 컬럼을 KR_nY 형식으로 변환하여 글로벌 데이터와 병합
-_merged_df: pd.DataFrame | None = None
-if _global_df is not None and _bond_df is not None:
-    _ktb_to_kr = {f"KTB_{t}Y": f"KR_{t}Y" for t in TENORS if f"KTB_{t}Y" in _bond_df.columns}
-    _kr_df = _bond_df[list(_ktb_to_kr.keys())].rename(columns=_ktb_to_kr)
-    _merged_df = TreasuryCalc.merge(_global_df, _kr_df)
-elif _global_df is not None:
-    _merged_df = _global_df
-
-
-# ─── 기준일: 실제 데이터의 마지막 날짜 ──────────────────────────────────────────
-
-_candidates = []
-if _merged_df is not None and not _merged_df.empty:
-    _candidates.append(_merged_df.index.max().date())
-if _bond_df is not None and not _bond_df.empty:
-    _candidates.append(_bond_df.index.max().date())
-TARGET_DATE = max(_candidates) if _candidates else date.today() - timedelta(days=1)
-
-TODAY     = TARGET_DATE
-TODAY_STR = TODAY.strftime("%Y-%m-%d")
-try:
-    START_DATE = TODAY.replace(year=TODAY.year - 1)
-except ValueError:  # 2월 29일인 경우
-    START_DATE = TODAY - timedelta(days=365)
-START_STR = START_DATE.strftime("%Y-%m-%d")
+@st.cache_data(show_spinner=False)
+def _build_merged(_global_df: pd.DataFrame, _bond_df: pd.DataFrame, source_mtimes: tuple) -> pd.DataFrame:
+    """
+    bond_summary의 KTB_nY 컬럼을 KR_nY 형식으로 변환하여 글로벌 데이터와 병합합니다.
+
+    병합 결과는 data/cache/merged.parquet 에 기록하고, 두 CSV보다 새로우면 병합 없이 재사용합니다.
+    source_mtimes(두 CSV 수정 시각)는 st.cache_data 키로만 쓰입니다.
+    """
+    cache_path = os.path.join(CACHE_DIR, "merged.parquet")
+    merged = _read_parquet_cache(cache_path, max(source_mtimes))
+    if merged is not None:
+        merged.attrs["source_mtime"] = max(source_mtimes)
+        return merged
+
+    ktb_to_kr = {f"KTB_{t}Y": f"KR_{t}Y" for t in TENORS if f"KTB_{t}Y" in _bond_df.columns}
+    kr_df     = _bond_df[list(ktb_to_kr.keys())].rename(columns=ktb_to_kr)
+    merged    = TreasuryCalc.merge(_global_df, kr_df)
+    _write_parquet_cache(merged, cache_path)
+    merged.attrs["source_mtime"] = max(source_mtimes)  # _data_key 용 원본 CSV 버전
+    return merged
+
+
+# ─── 채권 탭 데이터 준비 (채권 탭 진입 시에만 호출) ─────────────────────────────
+
+def _bootstrap_bond() -> tuple:
+    """
+    글로벌·국내·장외 데이터 로드, 병합, 기준일 계산.
+
+    주식 탭 rerun 에서는 호출되지 않으며, 로드·병합은 st.cache_data 로 캐시되어
+    채권 탭 rerun 에서도 디스크를 다시 읽지 않습니다.
+
+    Returns:
+        (global_df, bond_df, otc_df, merged_df, target_date)
+        target_date 는 실제 데이터의 마지막 날짜 (데이터가 없으면 어제).
+    """
+    global_df = _load_global()
+    bond_df   = _load_bond()
+    otc_df    = _load_otc()
+
+    merged_df = None
+    if global_df is not None and bond_df is not None:
+        merged_df = _build_merged(global_df, bond_df, (
+            os.path.getmtime(os.path.join(DATA_DIR, "global_treasury.csv")),
+            os.path.getmtime(os.path.join(DATA_DIR, "bond_summary.csv")),
+        ))
+    elif global_df is not None:
+        merged_df = global_df
+
+    candidates = []
+    if merged_df is not None and not merged_df.empty:
+        candidates.append(merged_df.index.max().date())
+    if bond_df is not None and not bond_df.empty:
+        candidates.append(bond_df.index.max().date())
+    target_date = max(candidates) if candidates else date.today() - timedelta(days=1)
+
+    return global_df, bond_df, otc_df, merged_df, target_date
 
 
 # ─── 채권 종목 한글 레이블 ────────────────────────────────────────────────────
@@ -109,26 +198,32 @@ BOND_LABELS: dict[str, str] = {
     "CORP_AA_3Y": "회사채AA-(3년)", "CORP_BBB_3Y": "회사채BBB-(3년)",
     "CD_91D": "CD(91일)",       "CP_91D": "CP(91일)",
 }
+# 선택 위젯·차트 범례·raw 표에 쓰는 "{한글 레이블} ({코드})" 표시명 (rerun 마다 재조합하지 않음)
+BOND_PRETTY: dict[str, str] = {k: f"{v} ({k})" for k, v in BOND_LABELS.items()}
 
-# KTB 만기 순서
+# KTB 만기 순서 / 컬럼명
 KTB_TENORS = [1, 2, 3, 5, 10, 20, 30, 50]
+KTB_COLS   = {t: f"KTB_{t}Y" for t in KTB_TENORS}
 
 
 # ─── 공통 헬퍼 ────────────────────────────────────────────────────────────────
 
-def _color_bp(val):
-    if pd.isna(val):
-        return ""
-    if isinstance(val, (int, float)):
-        if val > 0:
-            return "color: #ff4b4b"
-        if val < 0:
-            return "color: #0068c9"
-    return ""
+def _color_bp(sub: pd.DataFrame) -> pd.DataFrame:
+    """bp 컬럼 색상 (Styler.apply(axis=None) 용) — 양수 빨강 / 음수 파랑, subset 전체를 한 번에 계산."""
+    v = sub.to_numpy(dtype=float)
+    css = np.where(v > 0, "color: #ff4b4b", np.where(v < 0, "color: #0068c9", ""))
+    return pd.DataFrame(css, index=sub.index, columns=sub.columns)
+
 
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _build_bond_summary(_df: pd.DataFrame, data_key: tuple, target_date) -> pd.DataFrame:
+    """
+    각 채권 시리즈의 현재 금리 + 변화량(bp) 요약 테이블.
 
-def _build_bond_summary(df: pd.DataFrame, target_date) -> pd.DataFrame:
-    """각 채권 시리즈의 현재 금리 + 변화량(bp) 요약 테이블."""
+    읽기 전용 표시용 표라 st.cache_resource 로 세션 간 단일 객체를 공유합니다
+    (rerun 마다 pickle 복사 없음 — 호출 측에서 수정하지 말 것).
+    """
+    df    = _df
     today = pd.Timestamp(target_date)
     ref_infos = [
         ("1D",  today - pd.Timedelta(days=1)),
@@ -137,40 +232,138 @@ def _build_bond_summary(df: pd.DataFrame, target_date) -> pd.DataFrame:
         ("YTD", pd.Timestamp(today.year - 1, 12, 31)),
         ("YoY", today - pd.DateOffset(years=1)),
     ]
-    today_vals = TreasuryCalc.get_ref_value(df, today)
-    rows: dict = {}
-    for col in df.columns:
-        label = BOND_LABELS.get(col, col)
-        curr  = today_vals.get(col, float("nan")) if col in today_vals.index else float("nan")
-        row: dict = {"금리 (%)": curr}
-        for ref_label, ref_date in ref_infos:
-            ref_vals = TreasuryCalc.get_ref_value(df, ref_date)
-            ref      = ref_vals.get(col, float("nan")) if col in ref_vals.index else float("nan")
-            row[ref_label] = (curr - ref) * 100 if pd.notna(curr) and pd.notna(ref) else float("nan")
-        rows[label] = row
-    result = pd.DataFrame.from_dict(rows, orient="index")
-    result.index.name = "종목"
-    return result
-
-
-def _yield_curve_at(df: pd.DataFrame, country: str, ref_date) -> pd.Series:
-    """ref_date 이하 가장 가까운 날짜의 해당 국가 금리 커브를 반환합니다."""
-    cols       = [f"{country}_{t}Y" for t in TENORS]
-    avail_cols = [c for c in cols if c in df.columns]
-    if not avail_cols:
-        return pd.Series(float("nan"), index=TENORS, dtype=float)
-
-    avail_idx = df.index[df.index <= pd.Timestamp(ref_date)]
-    if len(avail_idx) == 0:
-        return pd.Series(float("nan"), index=TENORS, dtype=float)
-
-    row    = df.loc[avail_idx[-1], avail_cols]
-    result = pd.Series(index=TENORS, dtype=float)
-    for t in TENORS:
-        c = f"{country}_{t}Y"
-        if c in row.index:
-            result[t] = row[c]
-    return result
+    # 기준일 6개(오늘 + 비교 5개)를 한 번에 조회한 뒤 전 컬럼을 한꺼번에 차감
+    snap = TreasuryCalc.get_ref_values(df, [today] + [d for _, d in ref_infos]).to_numpy(dtype=float)
+    result = pd.DataFrame(
+        (snap[0] - snap[1:]).T * 100,
+        index=df.columns, columns=[label for label, _ in ref_infos],
+    )
+    result.insert(0, "금리 (%)", snap[0])
+    return result.rename(index=BOND_LABELS).rename_axis("종목")
+
+
+@st.cache_data(show_spinner=False)
+def _avail_countries(columns: tuple) -> list[str]:
+    """만기 컬럼이 하나라도 있는 국가 코드 목록 (COUNTRIES 순서)."""
+    colset = set(columns)
+    return [c for c in COUNTRIES if any(col in colset for col in COUNTRY_COLS[c])]
+
+
+@st.cache_data(show_spinner=False)
+def _avail_ktb_tenors(columns: tuple) -> list[int]:
+    """데이터에 존재하는 국고채 만기 목록 (KTB_TENORS 순서)."""
+    colset = set(columns)
+    return [t for t in KTB_TENORS if KTB_COLS[t] in colset]
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _raw_line_chart(
+    _df: pd.DataFrame, data_key: tuple, cols: tuple, title: str, labels: dict | None = None,
+) -> go.Figure:
+    """
+    raw 데이터 시계열 차트 — 시리즈별 Scattergl(WebGL) 트레이스.
+
+    long 형식 변환 없이 컬럼을 그대로 트레이스로 만들고, x/y 는 list 로 넘겨
+    plotly 의 typed-array 정리 과정을 거치지 않게 합니다.
+    (data_key, 선택 컬럼) 단위로 캐시되어, 선택이 그대로인 rerun 은 Figure 를 재사용합니다.
+    """
+    fig = go.Figure()
+    for c in cols:
+        s    = _df[c].dropna()
+        name = labels.get(c, c) if labels is not None else c
+        fig.add_trace(go.Scattergl(
+            x=s.index.tolist(), y=s.to_numpy(dtype=float).tolist(),
+            mode="lines", name=name,
+            hovertemplate="%{y:.3f}<extra>" + name + "</extra>",
+        ))
+    fig.update_layout(
+        title=title, hovermode="x unified",
+        xaxis_title="Date", yaxis_title="Yield (%)", legend_title_text="Series",
+    )
+    return fig
+
+
+def _raw_column_config(columns, labels: dict | None = None) -> dict:
+    """
+    raw 데이터 표의 st.dataframe column_config.
+
+    Styler(셀마다 HTML/CSS 생성) 대신 클라이언트 측 포맷을 사용합니다 — 날짜 인덱스는
+    YYYY-MM-DD, 값은 소수점 3자리. labels(예: BOND_PRETTY)가 주어지면 그 표시명을 씁니다.
+    """
+    config = {"_index": st.column_config.DateColumn("Date", format="YYYY-MM-DD")}
+    for c in columns:
+        label = labels.get(c, c) if labels is not None else c
+        config[c] = st.column_config.NumberColumn(label, format="%.3f")
+    return config
+
+
+def _curves_at(df: pd.DataFrame, cols: list[str], tenors: list[int], ref_dates) -> pd.DataFrame:
+    """
+    ref_dates 각각의 기준일 이하 가장 가까운 날짜의 금리 커브를 한 번에 반환합니다.
+
+    Returns:
+        행 = 기준일 순서(0, 1, ...), 열 = tenors 인 DataFrame. 없는 컬럼·이전 데이터 없음은 NaN.
+    """
+    snap = TreasuryCalc.get_ref_values(df, ref_dates).reindex(columns=cols)
+    return pd.DataFrame(snap.to_numpy(dtype=float), columns=tenors)
+
+
+def _data_key(df: pd.DataFrame) -> tuple:
+    """
+    st.cache_resource / st.cache_data 키로 쓰는 데이터 버전 식별자 (DataFrame 전체 해싱을 피함).
+
+    원본 CSV 수정 시각(로드 시 attrs["source_mtime"] 에 기록)을 포함해, 모양·마지막 날짜가
+    같은 채로 CSV 가 수정돼도 캐시가 갱신됩니다.
+    """
+    return (df.attrs.get("source_mtime"), df.shape, df.index.max(), tuple(df.columns))
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _change_summary(_df: pd.DataFrame, data_key: tuple, target_date) -> pd.DataFrame:
+    """주요국 금리 동향 요약 — 데이터 버전·기준일이 같으면 재계산하지 않습니다 (읽기 전용 공유 객체)."""
+    return TreasuryCalc.build_change_summary(_df, target_date=target_date)
+
+
+@st.cache_data(show_spinner=False)
+def _spread_stats(
+    _bond_df: pd.DataFrame, _otc_df: pd.DataFrame, data_key: tuple, cols: tuple,
+) -> tuple[pd.DataFrame, pd.Series, pd.Series]:
+    """최종호가 − 장외거래 스프레드(bp) 시계열과 전체 기간 평균·표준편차."""
+    bond_al, otc_al = _bond_df[list(cols)].align(_otc_df[list(cols)], join="inner")
+    spread_ts = (bond_al - otc_al) * 100
+    return spread_ts, spread_ts.mean(), spread_ts.std()
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _change_summary_html(_df: pd.DataFrame, data_key: tuple, target_date) -> str:
+    """
+    주요국 금리 동향 요약의 스타일 적용 HTML.
+
+    정적인 요약표라 Styler → HTML 변환을 데이터 버전·기준일 단위로 한 번만 수행하고,
+    rerun 시에는 캐시된 문자열을 그대로 st.html 로 렌더링합니다.
+    """
+    summary_df = _change_summary(_df, data_key, target_date)
+    pct_cols = [c for c in summary_df.columns if "%" in c[1]]
+    bp_cols  = [c for c in summary_df.columns if c not in pct_cols]
+    return (
+        summary_df.style
+        .format(precision=3, subset=pct_cols, na_rep="-")
+        .format(precision=1, subset=bp_cols, na_rep="-")
+        .apply(_color_bp, axis=None, subset=bp_cols)
+        .set_table_styles([
+            {"selector": "", "props": "width: 100%; border-collapse: collapse; font-size: 0.9rem;"},
+            {"selector": "th, td", "props": "text-align: center; padding: 4px 8px; "
+                                            "border-bottom: 1px solid rgba(128, 128, 128, 0.2);"},
+        ])
+        .to_html()
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _curves(_df: pd.DataFrame, data_key: tuple, country: str, ref_dates: tuple) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """ref_dates(현재 / 1주 전 / 1개월 전 Timestamp) 기준 금리 커브."""
+    frame = _curves_at(_df, COUNTRY_COLS[country], TENORS, ref_dates)
+    return frame.iloc[0], frame.iloc[1], frame.iloc[2]
 
 
 # ─── 사이드바 네비게이션 ────────────────────────────────────────────────────
@@ -243,6 +436,23 @@ with st.sidebar:
 
 if asset_class == "채권":
 
+    _global_df, _bond_df, _otc_df, _merged_df, TARGET_DATE = _bootstrap_bond()
+
+    # ─── 기준일: 실제 데이터의 마지막 날짜 ──────────────────────────────────────
+    TODAY     = TARGET_DATE
+    TODAY_STR = TODAY.strftime("%Y-%m-%d")
+    try:
+        START_DATE = TODAY.replace(year=TODAY.year - 1)
+    except ValueError:  # 2월 29일인 경우
+        START_DATE = TODAY - timedelta(days=365)
+    START_STR = START_DATE.strftime("%Y-%m-%d")
+
+    # 커브·시그널 조회용 기준일 Timestamp (한 번만 변환)
+    TODAY_TS  = pd.Timestamp(TODAY)
+    WEEK_TS   = TODAY_TS - pd.Timedelta(days=7)
+    MONTH_TS  = TODAY_TS - pd.Timedelta(days=30)
+    CURVE_REF_DATES = (TODAY_TS, WEEK_TS, MONTH_TS)
+
     # ── Analysis ─────────────────────────────────────────────────────────────
     if bond_view == "Analysis":
 
@@ -262,21 +472,7 @@ if asset_class == "채권":
                 st.subheader("주요국 금리 동향")
                 st.caption("2년물 / 10년물 기준  ·  bp = basis point (0.01%p)")
 
-                summary_df = TreasuryCalc.build_change_summary(_merged_df, target_date=TARGET_DATE)
-
-                format_dict = {}
-                for col in summary_df.columns:
-                    col_label = col[1] if isinstance(col, tuple) else col
-                    if "%" in col_label:
-                        format_dict[col] = "{:.3f}"
-                    else:
-                        format_dict[col] = "{:.1f}"
-
-                styled = summary_df.style.format(format_dict, na_rep="-")
-                bp_cols = [c for c in summary_df.columns if "금리" not in c[1]]
-                styled = styled.map(_color_bp, subset=bp_cols)
-                styled = styled.set_properties(**{"text-align": "center"})
-                st.dataframe(styled, use_container_width=True)
+                st.html(_change_summary_html(_merged_df, _data_key(_merged_df), TARGET_DATE))
 
                 st.divider()
                 st.subheader("국가별 Yield Curve")
@@ -285,10 +481,7 @@ if asset_class == "채권":
                     "US": "미국", "KR": "한국", "DE": "독일",
                     "GB": "영국", "JP": "일본", "CN": "중국",
                 }
-                avail_countries = [
-                    c for c in COUNTRIES
-                    if any(f"{c}_{t}Y" in _merged_df.columns for t in TENORS)
-                ]
+                avail_countries = _avail_countries(tuple(_merged_df.columns))
                 selected_code = st.selectbox(
                     "국가 선택",
                     options=avail_countries,
@@ -297,26 +490,26 @@ if asset_class == "채권":
                 )
                 selected_name = COUNTRY_MAP.get(selected_code, selected_code)
 
-                today_curve = _yield_curve_at(_merged_df, selected_code, TODAY)
-                week_curve  = _yield_curve_at(_merged_df, selected_code, TODAY - timedelta(days=7))
-                month_curve = _yield_curve_at(_merged_df, selected_code, TODAY - timedelta(days=30))
-                tenor_labels = [f"{t}Y" for t in TENORS]
+                today_curve, week_curve, month_curve = _curves(
+                    _merged_df, _data_key(_merged_df), selected_code, CURVE_REF_DATES,
+                )
+                tenor_labels = TENOR_LABELS
 
                 fig_curve = go.Figure()
-                if not today_curve.dropna().empty:
-                    fig_curve.add_trace(go.Scatter(
+                if today_curve.notna().any():
+                    fig_curve.add_trace(go.Scattergl(
                         x=tenor_labels, y=today_curve.values,
                         mode="lines+markers", name=f"현재 ({TODAY_STR})",
                         line=dict(width=2.5),
                     ))
-                if not week_curve.dropna().empty:
-                    fig_curve.add_trace(go.Scatter(
+                if week_curve.notna().any():
+                    fig_curve.add_trace(go.Scattergl(
                         x=tenor_labels, y=week_curve.values,
                         mode="lines+markers", name="1주 전",
                         line=dict(dash="dot", width=1.5), opacity=0.8,
                     ))
-                if not month_curve.dropna().empty:
-                    fig_curve.add_trace(go.Scatter(
+                if month_curve.notna().any():
+                    fig_curve.add_trace(go.Scattergl(
                         x=tenor_labels, y=month_curve.values,
                         mode="lines+markers", name="1개월 전",
                         line=dict(dash="dash", width=1.5), opacity=0.8,
@@ -338,8 +531,7 @@ if asset_class == "채권":
                 curve_styled = (
                     curve_table.style
                     .format({"현재(%)": "{:.3f}", "1W(bp)": "{:.1f}", "1M(bp)": "{:.1f}"}, na_rep="-")
-                    .map(_color_bp, subset=["1W(bp)", "1M(bp)"])
-                    .set_properties(**{"text-align": "center"})
+                    .apply(_color_bp, axis=None, subset=["1W(bp)", "1M(bp)"])
                 )
                 st.dataframe(curve_styled, use_container_width=True)
 
@@ -362,7 +554,7 @@ if asset_class == "채권":
                     st.subheader("국내 채권 금리 동향")
                     st.caption("단위: 금리 (%), 변화 bp (0.01%p)")
 
-                    bond_summary_df = _build_bond_summary(_bond_df, TARGET_DATE)
+                    bond_summary_df = _build_bond_summary(_bond_df, _data_key(_bond_df), TARGET_DATE)
                     bond_format = {
                         "금리 (%)": "{:.3f}", "1D": "{:.1f}", "1W": "{:.1f}",
                         "MTD": "{:.1f}", "YTD": "{:.1f}", "YoY": "{:.1f}",
@@ -371,45 +563,39 @@ if asset_class == "채권":
                     bond_styled = (
                         bond_summary_df.style
                         .format(bond_format, na_rep="-")
-                        .map(_color_bp, subset=bp_cols_bond)
-                        .set_properties(**{"text-align": "center"})
+                        .apply(_color_bp, axis=None, subset=bp_cols_bond)
                     )
                     st.dataframe(bond_styled, use_container_width=True)
 
                     st.divider()
 
-                    ktb_avail = [t for t in KTB_TENORS if f"KTB_{t}Y" in _bond_df.columns]
+                    ktb_avail = _avail_ktb_tenors(tuple(_bond_df.columns))
                     if ktb_avail:
                         st.subheader("국내 채권 Yield Curve")
                         ktb_tenor_labels = [f"{t}Y" for t in ktb_avail]
-                        ktb_cols         = [f"KTB_{t}Y" for t in ktb_avail]
+                        ktb_cols         = [KTB_COLS[t] for t in ktb_avail]
 
-                        def _ktb_curve_at(ref_date) -> pd.Series:
-                            avail_idx = _bond_df.index[_bond_df.index <= pd.Timestamp(ref_date)]
-                            if len(avail_idx) == 0:
-                                return pd.Series(float("nan"), index=ktb_avail, dtype=float)
-                            row = _bond_df.loc[avail_idx[-1], ktb_cols]
-                            return pd.Series(row.values, index=ktb_avail, dtype=float)
-
-                        today_ktb = _ktb_curve_at(TODAY)
-                        week_ktb  = _ktb_curve_at(TODAY - timedelta(days=7))
-                        month_ktb = _ktb_curve_at(TODAY - timedelta(days=30))
+                        ktb_frame = _curves_at(
+                            _bond_df, ktb_cols, ktb_avail,
+                            CURVE_REF_DATES,
+                        )
+                        today_ktb, week_ktb, month_ktb = ktb_frame.iloc[0], ktb_frame.iloc[1], ktb_frame.iloc[2]
 
                         fig_ktb = go.Figure()
-                        if not today_ktb.dropna().empty:
-                            fig_ktb.add_trace(go.Scatter(
+                        if today_ktb.notna().any():
+                            fig_ktb.add_trace(go.Scattergl(
                                 x=ktb_tenor_labels, y=today_ktb.values,
                                 mode="lines+markers", name=f"현재 ({TODAY_STR})",
                                 line=dict(width=2.5),
                             ))
-                        if not week_ktb.dropna().empty:
-                            fig_ktb.add_trace(go.Scatter(
+                        if week_ktb.notna().any():
+                            fig_ktb.add_trace(go.Scattergl(
                                 x=ktb_tenor_labels, y=week_ktb.values,
                                 mode="lines+markers", name="1주 전",
                                 line=dict(dash="dot", width=1.5), opacity=0.8,
                             ))
-                        if not month_ktb.dropna().empty:
-                            fig_ktb.add_trace(go.Scatter(
+                        if month_ktb.notna().any():
+                            fig_ktb.add_trace(go.Scattergl(
                                 x=ktb_tenor_labels, y=month_ktb.values,
                                 mode="lines+markers", name="1개월 전",
                                 line=dict(dash="dash", width=1.5), opacity=0.8,
@@ -434,8 +620,7 @@ if asset_class == "채권":
                         ktb_styled = (
                             ktb_curve_table.style
                             .format({"현재(%)": "{:.3f}", "1W(bp)": "{:.1f}", "1M(bp)": "{:.1f}"}, na_rep="-")
-                            .map(_color_bp, subset=["1W(bp)", "1M(bp)"])
-                            .set_properties(**{"text-align": "center"})
+                            .apply(_color_bp, axis=None, subset=["1W(bp)", "1M(bp)"])
                         )
                         st.dataframe(ktb_styled, use_container_width=True)
 
@@ -456,35 +641,27 @@ if asset_class == "채권":
                     if not common_cols:
                         st.warning("비교 가능한 공통 종목이 없습니다.")
                     else:
-                        today_bond = TreasuryCalc.get_ref_value(_bond_df, TODAY)
-                        today_otc  = TreasuryCalc.get_ref_value(_otc_df,  TODAY)
+                        today_bond = TreasuryCalc.get_ref_value(_bond_df, TODAY_TS)
+                        today_otc  = TreasuryCalc.get_ref_value(_otc_df,  TODAY_TS)
 
                         # ── 시그널 계산 (5Y 통계 기반 Z-score) ────────────────
-                        _bond_al, _otc_al = _bond_df[common_cols].align(
-                            _otc_df[common_cols], join="inner"
+                        spread_ts, mean_5y, std_5y = _spread_stats(
+                            _bond_df, _otc_df,
+                            (_data_key(_bond_df), _data_key(_otc_df)), tuple(common_cols),
                         )
-                        spread_ts = (_bond_al - _otc_al) * 100  # bp 시계열
-                        mean_5y   = spread_ts.mean()
-                        std_5y    = spread_ts.std()
 
-                        _avail_idx = spread_ts.index[spread_ts.index <= pd.Timestamp(TODAY)]
-                        if len(_avail_idx) > 0:
-                            today_spread_row = spread_ts.loc[_avail_idx[-1]]
-                        else:
-                            today_spread_row = pd.Series(float("nan"), index=common_cols)
+                        today_spread_row = TreasuryCalc.get_ref_value(spread_ts, TODAY_TS)
 
                         z_scores = (today_spread_row - mean_5y) / std_5y
 
-                        def _get_signal(z) -> str:
-                            if pd.isna(z):        return "Normal"
-                            if abs(z) >= 2.0:     return "Warning"
-                            if abs(z) >= 1.5:     return "Caution"
-                            return "Normal"
-
-                        signal_map = {col: _get_signal(z_scores[col]) for col in common_cols}
+                        # |Z| ≥ 2.0 Warning / ≥ 1.5 Caution / 그 외(NaN 포함) Normal
+                        abs_z  = z_scores.abs()
+                        signal = pd.Series("Normal", index=common_cols, dtype=object)
+                        signal[abs_z >= 1.5] = "Caution"
+                        signal[abs_z >= 2.0] = "Warning"
 
-                        n_warning = sum(1 for s in signal_map.values() if s == "Warning")
-                        n_caution = sum(1 for s in signal_map.values() if s == "Caution")
+                        n_warning = int((signal == "Warning").sum())
+                        n_caution = int((signal == "Caution").sum())
                         n_normal  = len(common_cols) - n_warning - n_caution
 
                         # ── 요약 배너 ──────────────────────────────────────────
@@ -497,20 +674,7 @@ if asset_class == "채권":
                         col_n.metric("✅ 정상",    f"{n_normal}종목")
 
                         # ── 시그널 종목 상세 테이블 ────────────────────────────
-                        signal_rows: dict = {}
-                        for col in common_cols:
-                            sig = signal_map[col]
-                            if sig == "Normal":
-                                continue
-                            label = BOND_LABELS.get(col, col)
-                            z     = z_scores[col]
-                            signal_rows[label] = {
-                                "현재(bp)":  today_spread_row[col] if pd.notna(today_spread_row[col]) else float("nan"),
-                                "5Y평균(bp)": mean_5y[col],
-                                "5Y표준편차(bp)": std_5y[col],
-                                "Z-score":   z,
-                                "시그널":    sig,
-                            }
+                        flagged = signal.index[signal != "Normal"]
 
                         _SIG_WARNING_BG = "background-color: rgba(255, 75, 75, 0.18)"
                         _SIG_CAUTION_BG = "background-color: rgba(255, 165, 0, 0.18)"
@@ -520,9 +684,14 @@ if asset_class == "채권":
                             if val == "Caution": return "⚡ Caution"
                             return val
 
-                        if signal_rows:
-                            sig_df = pd.DataFrame.from_dict(signal_rows, orient="index")
-                            sig_df.index.name = "종목"
+                        if len(flagged):
+                            sig_df = pd.DataFrame({
+                                "현재(bp)":       today_spread_row.reindex(flagged),
+                                "5Y평균(bp)":     mean_5y[flagged],
+                                "5Y표준편차(bp)": std_5y[flagged],
+                                "Z-score":        z_scores[flagged],
+                                "시그널":         signal[flagged],
+                            }).rename(index=BOND_LABELS).rename_axis("종목")
 
                             def _row_signal_style(row):
                                 sig = row["시그널"]
@@ -541,7 +710,6 @@ if asset_class == "채권":
                                     "Z-score":        "{:+.2f}",
                                 }, na_rep="-")
                                 .format({"시그널": _fmt_signal})
-                                .set_properties(**{"text-align": "center"})
                             )
                             st.dataframe(sig_styled, use_container_width=True)
                         else:
@@ -551,21 +719,14 @@ if asset_class == "채권":
 
                         # ── 전체 스프레드 비교 테이블 ──────────────────────────
                         st.subheader("최종호가 vs. 장외거래 상세")
-                        rows: dict = {}
-                        for col in common_cols:
-                            label    = BOND_LABELS.get(col, col)
-                            bond_val = today_bond[col] if col in today_bond.index else float("nan")
-                            otc_val  = today_otc[col]  if col in today_otc.index  else float("nan")
-                            spread   = (bond_val - otc_val) * 100 if pd.notna(bond_val) and pd.notna(otc_val) else float("nan")
-                            rows[label] = {
-                                "최종호가(%)":   bond_val,
-                                "장외거래(%)":   otc_val,
-                                "스프레드(bp)": spread,
-                                "시그널":       signal_map[col],
-                            }
-
-                        otc_cmp_df = pd.DataFrame.from_dict(rows, orient="index")
-                        otc_cmp_df.index.name = "종목"
+                        bond_now = today_bond.reindex(common_cols)
+                        otc_now  = today_otc.reindex(common_cols)
+                        otc_cmp_df = pd.DataFrame({
+                            "최종호가(%)":   bond_now,
+                            "장외거래(%)":   otc_now,
+                            "스프레드(bp)": (bond_now - otc_now) * 100,
+                            "시그널":       signal,
+                        }).rename(index=BOND_LABELS).rename_axis("종목")
 
                         def _row_signal_style_full(row):
                             sig = row["시그널"]
@@ -583,8 +744,7 @@ if asset_class == "채권":
                                 "스프레드(bp)": "{:.1f}",
                             }, na_rep="-")
                             .format({"시그널": _fmt_signal})
-                            .map(_color_bp, subset=["스프레드(bp)"])
-                            .set_properties(**{"text-align": "center"})
+                            .apply(_color_bp, axis=None, subset=["스프레드(bp)"])
                         )
                         st.dataframe(otc_cmp_styled, use_container_width=True)
 
@@ -608,18 +768,11 @@ if asset_class == "채권":
                     key="m_cols",
                 )
                 if selected:
-                    df_melt = _merged_df[selected].reset_index().melt(
-                        id_vars="Date", var_name="Series", value_name="Yield (%)"
-                    )
-                    fig_m = px.line(df_melt, x="Date", y="Yield (%)", color="Series",
-                                    title="글로벌 + KR 국채 금리")
-                    fig_m.update_layout(hovermode="x unified")
+                    fig_m = _raw_line_chart(_merged_df, _data_key(_merged_df), tuple(selected), "글로벌 + KR 국채 금리")
                     st.plotly_chart(fig_m, use_container_width=True)
 
-                df_m_display = _merged_df.copy()
-                df_m_display.index = df_m_display.index.strftime("%Y-%m-%d")
                 st.dataframe(
-                    df_m_display.style.format("{:.3f}", na_rep="-").set_properties(**{"text-align": "center"}),
+                    _merged_df, column_config=_raw_column_config(_merged_df.columns),
                     use_container_width=True,
                 )
 
@@ -640,27 +793,19 @@ if asset_class == "채권":
                 bond_selected = st.multiselect(
                     "표시할 시리즈",
                     options=bond_all_cols,
-                    format_func=lambda x: f"{BOND_LABELS.get(x, x)} ({x})",
+                    format_func=lambda x: BOND_PRETTY.get(x, x),
                     default=bond_default_cols,
                     key="bond_cols",
                 )
                 if bond_selected:
-                    df_bond_melt = _bond_df[bond_selected].reset_index().melt(
-                        id_vars="Date", var_name="Series", value_name="Yield (%)"
+                    fig_bond = _raw_line_chart(
+                        _bond_df, _data_key(_bond_df), tuple(bond_selected),
+                        "국내 채권 금리 시계열", BOND_PRETTY,
                     )
-                    df_bond_melt["Series"] = df_bond_melt["Series"].map(
-                        lambda x: f"{BOND_LABELS.get(x, x)} ({x})"
-                    )
-                    fig_bond = px.line(df_bond_melt, x="Date", y="Yield (%)", color="Series",
-                                       title="국내 채권 금리 시계열")
-                    fig_bond.update_layout(hovermode="x unified")
                     st.plotly_chart(fig_bond, use_container_width=True)
 
-                df_bond_display = _bond_df.copy()
-                df_bond_display.index   = df_bond_display.index.strftime("%Y-%m-%d")
-                df_bond_display.columns = [f"{BOND_LABELS.get(c, c)} ({c})" for c in df_bond_display.columns]
                 st.dataframe(
-                    df_bond_display.style.format("{:.3f}", na_rep="-").set_properties(**{"text-align": "center"}),
+                    _bond_df, column_config=_raw_column_config(_bond_df.columns, BOND_PRETTY),
                     use_container_width=True,
                 )
 
@@ -681,27 +826,19 @@ if asset_class == "채권":
                 otc_selected = st.multiselect(
                     "표시할 시리즈",
                     options=otc_all_cols,
-                    format_func=lambda x: f"{BOND_LABELS.get(x, x)} ({x})",
+                    format_func=lambda x: BOND_PRETTY.get(x, x),
                     default=otc_default_cols,
                     key="otc_cols",
                 )
                 if otc_selected:
-                    df_otc_melt = _otc_df[otc_selected].reset_index().melt(
-                        id_vars="Date", var_name="Series", value_name="Yield (%)"
-                    )
-                    df_otc_melt["Series"] = df_otc_melt["Series"].map(
-                        lambda x: f"{BOND_LABELS.get(x, x)} ({x})"
+                    fig_otc = _raw_line_chart(
+                        _otc_df, _data_key(_otc_df), tuple(otc_selected),
+                        "장외거래대표수익률 시계열", BOND_PRETTY,
                     )
-                    fig_otc = px.line(df_otc_melt, x="Date", y="Yield (%)", color="Series",
-                                      title="장외거래대표수익률 시계열")
-                    fig_otc.update_layout(hovermode="x unified")
                     st.plotly_chart(fig_otc, use_container_width=True)
 
-                df_otc_display = _otc_df.copy()
-                df_otc_display.index   = df_otc_display.index.strftime("%Y-%m-%d")
-                df_otc_display.columns = [f"{BOND_LABELS.get(c, c)} ({c})" for c in df_otc_display.columns]
                 st.dataframe(
-                    df_otc_display.style.format("{:.3f}", na_rep="-").set_properties(**{"text-align": "center"}),
+                    _otc_df, column_config=_raw_column_config(_otc_df.columns, BOND_PRETTY),
                     use_container_width=True,
                 )
 
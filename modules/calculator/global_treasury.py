@@ -2,12 +2,15 @@
 글로벌 국채 / 병합 데이터 분석
 
 TreasuryCalc
-  fill_calendar(df)              : 전체 달력 날짜로 reindex 후 forward fill
+  fill_calendar(df, ...)         : 전체 달력 날짜로 reindex 후 forward fill
   merge(global_df, kr_df)        : GlobalTreasury + KOFIA 데이터 병합
+  asof_pos(index, ref_date)      : 기준일 이하 마지막 행 위치 (이진 탐색)
   get_ref_value(df, ref_date)    : 기준일 이하 가장 가까운 행 반환
+  get_ref_values(df, ref_dates)  : 여러 기준일의 get_ref_value 를 한 번에 (행 = 기준일)
   build_change_summary(df, ...)  : 2Y/10Y 금리 + 1D/1W/MTD/YTD/YoY bp 요약 테이블
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -15,21 +18,32 @@ class TreasuryCalc:
     """글로벌 국채 + KOFIA 병합 데이터의 분석 및 요약."""
 
     @staticmethod
-    def fill_calendar(df: pd.DataFrame) -> pd.DataFrame:
+    def fill_calendar(df: pd.DataFrame, assume_sorted: bool = False) -> pd.DataFrame:
         """
         주말·공휴일을 포함한 전체 달력 날짜(일별)로 reindex 후 forward fill.
 
         Args:
-            df: Date 인덱스(date 또는 datetime)를 가진 DataFrame
+            df           : Date 인덱스(date 또는 datetime)를 가진 DataFrame
+            assume_sorted: True면 인덱스가 이미 오름차순·중복 없는 DatetimeIndex라고 보고
+                           변환·정렬 확인을 생략 (GlobalTreasury.collect 처럼 직접 만든 경우)
 
         Returns:
             전체 달력 날짜로 확장·fill된 DataFrame
         """
-        df = df.copy()
-        df.index = pd.to_datetime(df.index)
-        full = pd.date_range(df.index.min(), df.index.max(), freq="D")
-        df = df.reindex(full)
-        df = df.ffill()
+        if not assume_sorted:
+            if not isinstance(df.index, pd.DatetimeIndex):
+                df = df.set_axis(pd.to_datetime(df.index))  # 원본 비변경 (copy 불필요)
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+        full = pd.date_range(df.index[0], df.index[-1], freq="D")
+        # 거래일 행 안의 결측을 먼저 채운 뒤, 달력 확장과 채움을 reindex 한 번으로 처리
+        n_rows = len(df)
+        df = df.ffill().reindex(full, method="ffill")
+        if len(full) > n_rows:
+            # NaN 행을 거치던 기존 방식과 같이, 달력이 확장되면 정수 컬럼은 float64 로 반환
+            int_cols = df.select_dtypes(include="integer").columns
+            if len(int_cols):
+                df = df.astype({c: "float64" for c in int_cols})
         df.index.name = "Date"
         return df
 
@@ -45,33 +59,64 @@ class TreasuryCalc:
         Returns:
             전체 달력 날짜 기준으로 정렬된 병합 DataFrame
         """
-        g = global_df.copy()
-        g.index = pd.to_datetime(g.index)
-
-        k = kr_df.copy()
-        k.index = pd.to_datetime(k.index)
+        # 이미 DatetimeIndex면 그대로 사용 (join이 새 프레임을 반환하므로 copy 불필요)
+        g = global_df if isinstance(global_df.index, pd.DatetimeIndex) else global_df.set_axis(pd.to_datetime(global_df.index))
+        k = kr_df     if isinstance(kr_df.index, pd.DatetimeIndex)     else kr_df.set_axis(pd.to_datetime(kr_df.index))
 
         merged = g.join(k, how="outer")
         merged = merged.ffill()
-        merged = merged.sort_index()
+        if not merged.index.is_monotonic_increasing:
+            merged = merged.sort_index()
         return merged
 
+    @staticmethod
+    def asof_pos(index: pd.DatetimeIndex, ref_date) -> int | None:
+        """
+        정렬된 DatetimeIndex에서 ref_date 이하 마지막 위치를 이진 탐색으로 반환.
+
+        Args:
+            index   : 오름차순 정렬된 DatetimeIndex
+            ref_date: 기준 날짜 (date / datetime / str)
+
+        Returns:
+            정수 위치. ref_date 이하 날짜가 없으면 None.
+        """
+        ts  = ref_date if isinstance(ref_date, pd.Timestamp) else pd.Timestamp(ref_date)
+        pos = index.searchsorted(ts, side="right") - 1
+        return None if pos < 0 else int(pos)
+
     @staticmethod
     def get_ref_value(df: pd.DataFrame, ref_date) -> pd.Series:
         """
         ref_date 이하 가장 가까운 날짜의 행을 반환.
 
         Args:
-            df      : DatetimeIndex를 가진 DataFrame
+            df      : 오름차순 정렬된 DatetimeIndex를 가진 DataFrame
             ref_date: 기준 날짜 (date / datetime / str)
 
         Returns:
             해당 날짜의 pd.Series. 이전 데이터가 없으면 NaN Series.
         """
-        avail = df.index[df.index <= pd.Timestamp(ref_date)]
-        if len(avail) == 0:
+        pos = TreasuryCalc.asof_pos(df.index, ref_date)
+        if pos is None:
             return pd.Series(float("nan"), index=df.columns, dtype=float)
-        return df.loc[avail[-1]]
+        return df.iloc[pos]
+
+    @staticmethod
+    def get_ref_values(df: pd.DataFrame, ref_dates) -> pd.DataFrame:
+        """
+        여러 기준일 각각에 대해 이하 가장 가까운 날짜의 행을 한 번에 조회.
+
+        Args:
+            df       : 오름차순 정렬·중복 없는 DatetimeIndex를 가진 DataFrame
+            ref_dates: 기준 날짜 목록 (순서 무관)
+
+        Returns:
+            행 i 가 ref_dates[i] 기준 get_ref_value 결과인 DataFrame.
+            이전 데이터가 없는 기준일의 행은 NaN.
+        """
+        targets = pd.DatetimeIndex(ref_dates)
+        return df.reindex(targets, method="pad")
 
     @staticmethod
     def build_change_summary(df: pd.DataFrame, target_date=None) -> pd.DataFrame:
@@ -89,8 +134,6 @@ class TreasuryCalc:
         """
         today = df.index.max() if target_date is None else pd.Timestamp(target_date)
 
-        today_vals = TreasuryCalc.get_ref_value(df, today)
-
         ref_infos = [
             ("1D",  today - pd.Timedelta(days=1)),
             ("1W",  today - pd.Timedelta(days=7)),
@@ -98,34 +141,32 @@ class TreasuryCalc:
             ("YTD", pd.Timestamp(today.year - 1, 12, 31)),
             ("YoY", today - pd.DateOffset(years=1)),
         ]
+        ref_labels = [label for label, _ in ref_infos]
 
         country_map    = {"US": "미국", "KR": "한국", "DE": "독일", "GB": "영국", "JP": "일본", "CN": "중국"}
         ordered_codes  = ["US", "KR", "DE", "GB", "JP", "CN"]
-
-        data: dict = {}
-        for code in ordered_codes:
-            c_name = country_map.get(code, code)
-            data[c_name] = {}
-            for tenor in [2, 10]:
-                tenor_label = f"{tenor}년물"
-                col_key     = f"{code}_{tenor}Y"
-                curr        = today_vals.get(col_key, float("nan")) if col_key in today_vals.index else float("nan")
-                data[c_name][(tenor_label, "금리 (%)")] = curr
-                for label, ref_date in ref_infos:
-                    ref_vals = TreasuryCalc.get_ref_value(df, ref_date)
-                    ref      = ref_vals.get(col_key, float("nan")) if col_key in ref_vals.index else float("nan")
-                    diff     = (curr - ref) * 100 if pd.notna(curr) and pd.notna(ref) else float("nan")
-                    data[c_name][(tenor_label, label)] = diff
-
-        df_result = pd.DataFrame.from_dict(data, orient="index")
-
-        cols = []
-        for t in ["2년물", "10년물"]:
-            cols.append((t, "금리 (%)"))
-            for label, _ in ref_infos:
-                cols.append((t, label))
-
-        df_result.columns = pd.MultiIndex.from_tuples(df_result.columns)
-        df_result = df_result[cols]
-        df_result.index.name = "구분"
+        tenors         = [2, 10]
+
+        # 오늘 + 기준일 5개 행을 한 번에 조회 → (6, 국가×만기) 행렬, 없는 컬럼은 NaN
+        col_keys = [f"{code}_{t}Y" for code in ordered_codes for t in tenors]
+        snap = (
+            TreasuryCalc.get_ref_values(df, [today] + [d for _, d in ref_infos])
+            .reindex(columns=col_keys)
+            .to_numpy(dtype=float)
+            .reshape(1 + len(ref_infos), len(ordered_codes), len(tenors))
+        )
+        curr  = snap[0]                    # (국가, 만기)
+        diffs = (curr - snap[1:]) * 100    # (기준일, 국가, 만기) — NaN 은 그대로 전파
+
+        # 만기 블록마다 [금리, 1D, 1W, MTD, YTD, YoY] 순으로 가로 결합
+        values = np.hstack([
+            np.column_stack([curr[:, j], diffs[:, :, j].T]) for j in range(len(tenors))
+        ])
+        columns = pd.MultiIndex.from_tuples([
+            (f"{t}년물", label) for t in tenors for label in ["금리 (%)"] + ref_labels
+        ])
+        df_result = pd.DataFrame(
+            values, columns=columns,
+            index=pd.Index([country_map.get(c, c) for c in ordered_codes], name="구분"),
+        )
         return df_result
@@ -12,6 +12,16 @@ KofiaCalc
 import re
 import pandas as pd
 
+# ─── 컬럼명 파싱 정규식 (모듈 로드 시 1회 컴파일) ─────────────────────────────
+_RE_WS     = re.compile(r"\s+")
+_RE_YEAR   = re.compile(r"\((\d+)년\)")
+_RE_KTB    = re.compile(r"국고채[권]?\((\d+)년\)")
+_RE_KR_COL = re.compile(r"KR_(\d+)Y$")
+_RE_DIGITS = re.compile(r"\d+")
+
+# standardize_bond 컬럼 순서 (KTB → NHB → MSB → KEPCO → KDB → CORP → CD → CP)
+_BOND_PREFIX_RANK = {p: i for i, p in enumerate(["KTB", "NHB", "MSB", "KEPCO", "KDB", "CORP", "CD", "CP"])}
+
 
 class KofiaCalc:
     """KOFIA 수집 데이터의 표준화 및 캘린더 채움 처리."""
@@ -27,14 +37,35 @@ class KofiaCalc:
         Returns:
             전체 달력 날짜로 확장·fill된 DataFrame
         """
-        df = df.copy()
-        df.index = pd.to_datetime(df.index)
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df = df.set_axis(pd.to_datetime(df.index))  # 원본 비변경 (copy 불필요)
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
         full = pd.date_range(df.index.min(), df.index.max(), freq="D")
-        df = df.reindex(full)
-        df = df.ffill()
+        # 거래일 행 안의 결측을 먼저 채운 뒤, 달력 확장과 채움을 reindex 한 번으로 처리
+        n_rows = len(df)
+        df = df.ffill().reindex(full, method="ffill")
+        if len(full) > n_rows:
+            # NaN 행을 거치던 기존 방식과 같이, 달력이 확장되면 정수 컬럼은 float64 로 반환
+            int_cols = df.select_dtypes(include="integer").columns
+            if len(int_cols):
+                df = df.astype({c: "float64" for c in int_cols})
         df.index.name = "Date"
         return df
 
+    @staticmethod
+    def _to_numeric(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        숫자형이 아닌 컬럼만 pd.to_numeric(errors="coerce") 변환.
+
+        이미 숫자형으로 읽힌 컬럼(대부분)은 건너뛰고, 위치 기준(isetitem)으로 바꿔
+        중복 컬럼명이 있어도 안전합니다.
+        """
+        for i, dtype in enumerate(df.dtypes):
+            if not pd.api.types.is_numeric_dtype(dtype):
+                df.isetitem(i, pd.to_numeric(df.iloc[:, i], errors="coerce"))
+        return df
+
     @staticmethod
     def standardize(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -63,7 +94,7 @@ class KofiaCalc:
 
         rename_map: dict[str, str] = {}
         for col in df.columns:
-            m = re.search(r"\((\d+)\ub144\)", str(col))  # '\ub144' = '년'
+            m = _RE_YEAR.search(str(col))
             if m:
                 rename_map[col] = f"KR_{m.group(1)}Y"
 
@@ -75,12 +106,11 @@ class KofiaCalc:
 
         df = df.rename(columns=rename_map)
 
-        kr_cols = sorted(
-            [c for c in df.columns if re.match(r"KR_\d+Y$", c)],
-            key=lambda x: int(re.search(r"\d+", x).group()),
-        )
+        # KR_nY 컬럼만 만기 순으로 (매칭 1회로 만기 숫자까지 추출)
+        kr_tenors = {c: int(m.group(1)) for c in df.columns if (m := _RE_KR_COL.match(c))}
+        kr_cols   = sorted(kr_tenors, key=kr_tenors.__getitem__)
         df = df[kr_cols]
-        df = df.apply(pd.to_numeric, errors="coerce")
+        df = KofiaCalc._to_numeric(df)
 
         return KofiaCalc.fill_calendar(df)
 
@@ -94,28 +124,28 @@ class KofiaCalc:
         매핑 불가 시 None 반환 → 해당 컬럼은 standardize_bond에서 제외됩니다.
         """
         # 공백·개행 제거 후 매칭 (XLS 헤더에 \n이 포함될 수 있음)
-        s = re.sub(r"\s+", "", s)
+        s = _RE_WS.sub("", s)
         # 국고채(n년) / 국고채권(n년)
-        m = re.search(r"국고채[권]?\((\d+)년\)", s)
+        m = _RE_KTB.search(s)
         if m:
             return f"KTB_{m.group(1)}Y"
         # 국민주택1종(n년)
         if "국민주택" in s:
-            m = re.search(r"\((\d+)년\)", s)
+            m = _RE_YEAR.search(s)
             return f"NHB_{m.group(1)}Y" if m else None
         # 통안증권
         if "통안" in s:
             if "91" in s:
                 return "MSB_91D"
-            m = re.search(r"\((\d+)년\)", s)
+            m = _RE_YEAR.search(s)
             return f"MSB_{m.group(1)}Y" if m else None
         # 한전채(n년) / 한국전력(n년) — 최종호가수익률: 한전채, OTC: 한국전력
         if "한전" in s or "한국전력" in s:
-            m = re.search(r"\((\d+)년\)", s)
+            m = _RE_YEAR.search(s)
             return f"KEPCO_{m.group(1)}Y" if m else None
         # 산금채(n년)
         if "산금" in s:
-            m = re.search(r"\((\d+)년\)", s)
+            m = _RE_YEAR.search(s)
             return f"KDB_{m.group(1)}Y" if m else None
         # 회사채 AA- / BBB- (최종호가수익률: 회사채, OTC: 무보증)
         if "회사채" in s or "무보증" in s:
@@ -132,6 +162,13 @@ class KofiaCalc:
             return "CP_91D"
         return None
 
+    @staticmethod
+    def _bond_sort_key(code: str) -> tuple[int, int]:
+        """표준 코드('PREFIX_...') 정렬 키: (_BOND_PREFIX_RANK 순위, 코드 내 첫 숫자)."""
+        prefix, _, rest = code.partition("_")
+        num = _RE_DIGITS.search(rest)
+        return (_BOND_PREFIX_RANK.get(prefix, len(_BOND_PREFIX_RANK)), int(num.group()) if num else 0)
+
     @staticmethod
     def standardize_bond(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -162,7 +199,8 @@ class KofiaCalc:
         df[date_col] = pd.to_datetime(df[date_col])
         df = df.set_index(date_col)
         df.index.name = "Date"
-        df = df.sort_index(ascending=True)
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index(ascending=True)
 
         # 영문 코드 매핑 (매핑 안 되는 컬럼은 제외)
         rename_map: dict[str, str] = {}
@@ -183,19 +221,9 @@ class KofiaCalc:
 
         df = df[list(rename_map.keys())]
         df = df.rename(columns=rename_map)
-        df = df.apply(pd.to_numeric, errors="coerce")
-
-        # 컬럼 순서 정렬 (KTB → NHB → MSB → KEPCO → KDB → CORP → CD → CP)
-        prefix_order = ["KTB", "NHB", "MSB", "KEPCO", "KDB", "CORP", "CD", "CP"]
-
-        def _col_sort_key(c: str) -> tuple:
-            for i, prefix in enumerate(prefix_order):
-                if c.startswith(prefix):
-                    num = re.search(r"\d+", c)
-                    return (i, int(num.group()) if num else 0)
-            return (len(prefix_order), 0)
+        df = KofiaCalc._to_numeric(df)
 
-        sorted_cols = sorted(df.columns, key=_col_sort_key)
+        sorted_cols = sorted(df.columns, key=KofiaCalc._bond_sort_key)
         df = df[sorted_cols]
 
         return KofiaCalc.fill_calendar(df)
@@ -2,7 +2,7 @@
 investing.com 데이터 수집기
 
 GlobalTreasury : 글로벌 주요국 국채 금리 (Playwright Chromium)
-  collect(start_date, end_date) -> pd.DataFrame | None
+  collect(start_date, end_date, max_workers=5) -> pd.DataFrame | None
 
 수집 국가: US / DE / GB / JP / CN  |  만기: 2/3/5/10/20/30년
 컬럼 형식: {CC}_{n}Y  (예: US_10Y, DE_2Y)
@@ -11,18 +11,33 @@ GlobalTreasury : 글로벌 주요국 국채 금리 (Playwright Chromium)
   1. Playwright Chromium headless → Cloudflare 우회 (실제 브라우저 실행)
   2. __NEXT_DATA__ > props.pageProps.state.bondStore.instrumentId 에서 pair_id 추출
   3. page.evaluate() fetch POST /instruments/HistoricalDataAjax → HTML 테이블 파싱
+  4. 국가별 스레드(각자 Chromium 세션)로 동시 수집, 국가 내 만기는 순차 + 요청 간 최소 0.5초
+     (403/429/503·챌린지 페이지 응답 시 간격을 늘리는 백오프)
+  5. data/cache/investing/ 디스크 캐시 — pair_id(JSON) + 만기별 누적 시계열(hist_{pair_id}.parquet)
+     → 캐시 적중 시 페이지 탐색 생략, 캐시 이후 구간만 새로 조회 (브라우저도 필요할 때만 실행)
+  6. 챌린지 통과 후 브라우저 storage state(pw_state.json) 저장 → 다음 실행에서 쿠키 재사용
 """
 
+import os
 import re
 import sys
 import json
 import time
-from io import StringIO
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
+import lxml.html
+import numpy as np
 import pandas as pd
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
+
+try:  # 선택 의존성: 있으면 __NEXT_DATA__ 디코딩에 orjson 사용
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 _root = Path(__file__).resolve().parents[2]
 if str(_root) not in sys.path:
@@ -30,6 +45,49 @@ if str(_root) not in sys.path:
 
 from modules.calculator.global_treasury import TreasuryCalc  # noqa: E402
 
+# ─── 디스크 캐시 ──────────────────────────────────────────────────────────────
+_CACHE_DIR     = _root / "data" / "cache" / "investing"
+_PAIR_ID_PATH  = _CACHE_DIR / "pair_ids.json"
+_PW_STATE_PATH = _CACHE_DIR / "pw_state.json"   # Cloudflare 쿠키 등 브라우저 storage state
+_PAIR_TTL_SEC  = 30 * 24 * 60 * 60     # pair_id 는 사실상 불변 → 항목별 저장 후 30일마다 재확인
+_cache_lock    = threading.Lock()      # 국가별 스레드가 pair_id 캐시·상태 파일을 공유
+
+# ─── pair_id 추출 정규식 (모듈 로드 시 1회 컴파일) ──────────────────────────
+_RE_NEXT_DATA = re.compile(r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.DOTALL)
+_RE_PAIR_ID_FALLBACKS = tuple(re.compile(p) for p in (
+    r'"pair_id"\s*:\s*(\d{4,})',
+    r"'pair_id'\s*:\s*(\d{4,})",
+    r'data-pair-id=["\'](\d{4,})["\']',
+    r'var\s+pair_id\s*=\s*(\d{4,})',
+))
+
+# ─── 요청 간격 ────────────────────────────────────────────────────────────────
+_MIN_SLEEP_SEC = 0.5                  # 세션당 최소 요청 간격 (정상 응답이 이어져도 유지)
+_MAX_SLEEP_SEC = 8.0                  # 백오프 상한
+_BLOCK_STATUS  = frozenset({403, 429, 503})   # Cloudflare 차단·속도 제한 응답
+
+# Cloudflare 챌린지 페이지 표식 (상태 200 으로 와도 차단으로 간주)
+_RE_CHALLENGE  = re.compile(r"challenge-platform|<title>Just a moment", re.IGNORECASE)
+
+# 페이지 탐색 시 내려받지 않을 리소스 유형 (HTML·스크립트·XHR 만 필요)
+_BLOCKED_RESOURCES = frozenset({"image", "media", "font", "stylesheet"})
+
+# __NEXT_DATA__ 내 pair_id 가 놓이는 알려진 경로 (순서대로 확인 후, 없으면 전체 탐색)
+_PAIR_ID_PATHS: tuple[tuple[str, ...], ...] = (
+    ("props", "pageProps", "state", "bondStore", "instrumentId"),
+    ("props", "pageProps", "pageData", "instrumentId"),
+    ("props", "pageProps", "instrumentId"),
+)
+
+# 만기 하나의 시계열: (datetime64[ns] 날짜 배열, float64 수익률 배열), 날짜 오름차순
+Hist = tuple[np.ndarray, np.ndarray]
+
+
+@lru_cache(maxsize=64)
+def _to_mdy(date_str: str) -> str:
+    """"YYYY-MM-DD" → HistoricalDataAjax 형식 "MM/DD/YYYY" (같은 날짜는 한 번만 변환)."""
+    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%m/%d/%Y")
+
 
 class GlobalTreasury:
     """
@@ -88,8 +146,17 @@ class GlobalTreasury:
     INVESTING_BASE = "https://www.investing.com/rates-bonds"
     HIST_AJAX_URL  = "https://www.investing.com/instruments/HistoricalDataAjax"
 
-    def __init__(self) -> None:
-        self._pair_id_cache: dict[str, int] = {}
+    def __init__(self, pair_id_cache: dict[str, dict] | None = None) -> None:
+        """
+        Args:
+            pair_id_cache: 공유할 pair_id 캐시 (slug → {"pair_id", "saved_at"}).
+                           None 이면 디스크(pair_ids.json)에서 로드합니다.
+        """
+        self._pair_id_cache: dict[str, dict] = (
+            self._load_pair_ids() if pair_id_cache is None else pair_id_cache
+        )
+        self._debug_html_saved = False
+        self._next_sleep = _MIN_SLEEP_SEC  # 적응형 요청 간격 (초) — 차단 시 증가, 성공 시 최소값까지 감소
         self._pw      = None
         self._browser = None
         self._ctx     = None
@@ -111,9 +178,36 @@ class GlobalTreasury:
                 "Chrome/120.0.0.0 Safari/537.36"
             ),
             viewport={"width": 1920, "height": 1080},
+            # 이전 실행의 Cloudflare 통과 쿠키 재사용 (없으면 새로 챌린지)
+            storage_state=str(_PW_STATE_PATH) if _PW_STATE_PATH.exists() else None,
         )
+        self._ctx.route("**/*", self._route_filter)
         self._page    = self._ctx.new_page()
         self._debug_html_saved = False
+        self._state_saved      = False
+
+    @staticmethod
+    def _route_filter(route) -> None:
+        """이미지·폰트·CSS·미디어 요청은 차단 (__NEXT_DATA__ 추출과 무관, 전송량 절감)."""
+        if route.request.resource_type in _BLOCKED_RESOURCES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _save_storage_state(self) -> None:
+        """챌린지 통과 후 세션당 1회 storage state 를 기록합니다 (임시 파일 + 교체)."""
+        if self._state_saved or self._ctx is None:
+            return
+        self._state_saved = True
+        try:
+            state = self._ctx.storage_state()
+            with _cache_lock:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp = _PW_STATE_PATH.with_suffix(".json.tmp")
+                tmp.write_text(json.dumps(state), encoding="utf-8")
+                os.replace(tmp, _PW_STATE_PATH)
+        except Exception as e:
+            print(f"    [캐시] 브라우저 상태 저장 실패: {e}")
 
     def _stop_browser(self) -> None:
         try:
@@ -126,19 +220,138 @@ class GlobalTreasury:
             pass
         self._page = self._ctx = self._browser = self._pw = None
 
+    def _ensure_page(self, slug: str) -> None:
+        """브라우저를 필요할 때만 띄우고, fetch 전 investing.com 오리진(Cloudflare 쿠키)을 확보합니다."""
+        if self._page is None:
+            self._start_browser()
+        if not self._page.url.startswith("https://www.investing.com"):
+            self._pace()
+            resp = self._page.goto(
+                f"{self.INVESTING_BASE}/{slug}-historical-data",
+                wait_until="domcontentloaded", timeout=15_000,
+            )
+            ready = self._wait_ready()
+            self._note_status(resp.status if resp else None, blocked=not ready)
+            if ready:
+                self._save_storage_state()
+
+    def _wait_ready(self, timeout_ms: int = 15_000) -> bool:
+        """
+        Cloudflare 챌린지 통과 후 __NEXT_DATA__ 스크립트가 붙을 때까지 대기합니다.
+
+        고정 5초 대기 대신 준비되는 즉시 True 를 반환하며, 시간 초과 시에도 예외 없이
+        False 를 반환해 호출 측의 HTML 정규식 폴백이 동작하도록 합니다.
+        """
+        try:
+            self._page.wait_for_selector("script#__NEXT_DATA__", state="attached", timeout=timeout_ms)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    # ── 요청 간격 (적응형 백오프) ─────────────────────────────────────────────
+
+    def _pace(self) -> None:
+        """요청 전 대기. 정상 응답이 이어지면 최소 간격(_MIN_SLEEP_SEC)만 쉽니다."""
+        time.sleep(self._next_sleep)
+
+    def _note_status(self, status: int | None, blocked: bool = False) -> bool:
+        """
+        응답 상태로 다음 요청 간격을 조정합니다.
+
+        Args:
+            status : HTTP 상태 코드 (없으면 None)
+            blocked: 챌린지 페이지 등 상태 코드와 무관하게 차단으로 판단된 경우 True
+
+        Returns:
+            차단·속도 제한(403/429/503 또는 blocked)이면 True — 호출 측에서 재시도 여부 판단용.
+        """
+        if blocked or status in _BLOCK_STATUS:
+            self._next_sleep = min(self._next_sleep * 2 + 1, _MAX_SLEEP_SEC)
+            return True
+        if status is not None and 200 <= status < 300:
+            self._next_sleep = max(self._next_sleep * 0.5, _MIN_SLEEP_SEC)
+        return False
+
+    # ── 디스크 캐시 ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _load_pair_ids() -> dict[str, dict]:
+        """
+        pair_ids.json 로드. 항목별 저장 시각(saved_at)이 _PAIR_TTL_SEC 을 넘었거나
+        형식이 맞지 않는 항목은 버려 다시 조회되도록 합니다.
+        """
+        try:
+            raw = json.loads(_PAIR_ID_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        cache: dict[str, dict] = {}
+        for slug, entry in (raw.items() if isinstance(raw, dict) else ()):
+            try:
+                pair_id, saved_at = int(entry["pair_id"]), float(entry["saved_at"])
+            except (TypeError, KeyError, ValueError):
+                continue
+            if now - saved_at <= _PAIR_TTL_SEC:
+                cache[slug] = {"pair_id": pair_id, "saved_at": saved_at}
+        return cache
+
+    def _save_pair_id(self, slug: str, pair_id: int) -> None:
+        with _cache_lock:
+            self._pair_id_cache[slug] = {"pair_id": pair_id, "saved_at": time.time()}
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # 임시 파일에 쓴 뒤 교체 → 중단돼도 깨진 JSON이 남지 않음
+                tmp = _PAIR_ID_PATH.with_suffix(".json.tmp")
+                tmp.write_text(json.dumps(self._pair_id_cache, indent=2), encoding="utf-8")
+                os.replace(tmp, _PAIR_ID_PATH)
+            except OSError as e:
+                print(f"    [캐시] pair_id 저장 실패: {e}")
+
+    @staticmethod
+    def _hist_cache_path(pair_id: int) -> Path:
+        return _CACHE_DIR / f"hist_{pair_id}.parquet"
+
+    @staticmethod
+    def _read_hist_cache(path: Path) -> tuple[Hist, str, str] | None:
+        """누적 캐시 → ((날짜, 수익률), 수집 시작일, 수집 종료일). 없거나 읽을 수 없으면 None."""
+        try:
+            df = pd.read_parquet(path)
+            cov_start, cov_end = df.attrs["cov_start"], df.attrs["cov_end"]
+        except Exception:
+            return None
+        return (df.index.to_numpy(dtype="datetime64[ns]"), df["Price"].to_numpy(dtype=float)), cov_start, cov_end
+
+    @staticmethod
+    def _write_hist_cache(path: Path, hist: Hist, cov_start: str, cov_end: str) -> None:
+        """만기별 누적 캐시 기록. 수집 구간은 parquet 메타데이터(attrs)에 함께 저장합니다."""
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df = pd.DataFrame({"Price": hist[1]}, index=pd.DatetimeIndex(hist[0]))
+            df.attrs = {"cov_start": cov_start, "cov_end": cov_end}
+            tmp = path.with_suffix(".parquet.tmp")
+            df.to_parquet(tmp)
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"    [캐시] 시계열 저장 실패: {e}")
+
     # ── pair_id 조회 ──────────────────────────────────────────────────────────
 
     def _get_pair_id(self, slug: str) -> int | None:
-        if slug in self._pair_id_cache:
-            return self._pair_id_cache[slug]
+        entry = self._pair_id_cache.get(slug)
+        if entry is not None and time.time() - entry["saved_at"] <= _PAIR_TTL_SEC:
+            return entry["pair_id"]
 
         url = f"{self.INVESTING_BASE}/{slug}-historical-data"
         try:
+            if self._page is None:
+                self._start_browser()
+            self._pace()
             resp = self._page.goto(url, wait_until="domcontentloaded", timeout=15_000)
             if resp and resp.status == 404:
                 return None
-            # Cloudflare JS 챌린지 처리 대기 (충분한 시간 확보)
-            self._page.wait_for_timeout(5_000)
+            # Cloudflare JS 챌린지 처리 대기 (__NEXT_DATA__ 등장 시 즉시 진행) — 끝내 없으면 차단으로 간주
+            ready = self._wait_ready()
+            self._note_status(resp.status if resp else None, blocked=not ready)
         except Exception as e:
             print(f"    [경고] 페이지 접근 실패 ({slug}): {e}")
             return None
@@ -146,7 +359,8 @@ class GlobalTreasury:
         html = self._page.content()
         pair_id = self._extract_pair_id(html)
         if pair_id:
-            self._pair_id_cache[slug] = pair_id
+            self._save_pair_id(slug, pair_id)
+            self._save_storage_state()
         else:
             print(f"    [경고] pair_id 미발견 ({slug})")
             # 첫 번째 실패 시 HTML 저장 (원인 파악용)
@@ -158,16 +372,36 @@ class GlobalTreasury:
                 print(f"    [디버그] HTML 저장 → {debug_path}")
         return pair_id
 
+    @staticmethod
+    def _next_data_blob(html: str) -> str | None:
+        """
+        __NEXT_DATA__ 스크립트 본문을 반환합니다.
+
+        리터럴 str.find 두 번으로 잘라내고, 속성 따옴표가 달라 못 찾을 때만 정규식으로 폴백합니다.
+        """
+        pos = html.find('id="__NEXT_DATA__"')
+        if pos >= 0:
+            start = html.find(">", pos) + 1
+            end   = html.find("</script>", start)
+            if start > 0 and end >= 0:
+                return html[start:end]
+        m = _RE_NEXT_DATA.search(html)
+        return m.group(1) if m else None
+
     @staticmethod
     def _extract_pair_id(html: str) -> int | None:
-        m = re.search(r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', html, re.DOTALL)
-        if m:
+        blob = GlobalTreasury._next_data_blob(html)
+        if blob:
             try:
-                nd    = json.loads(m.group(1))
-                state = nd.get("props", {}).get("pageProps", {}).get("state", {})
-                instrument_id = state.get("bondStore", {}).get("instrumentId")
-                if instrument_id is not None:
-                    v = int(instrument_id)
+                nd = _json_loads(blob)
+                for path in _PAIR_ID_PATHS:
+                    instrument_id = GlobalTreasury._dig(nd, path)
+                    if instrument_id is None:
+                        continue
+                    try:
+                        v = int(instrument_id)
+                    except (TypeError, ValueError):
+                        continue  # 경로 값이 숫자가 아니면 다음 후보 경로로
                     if v > 0:
                         return v
                 found = GlobalTreasury._search_in_json(nd)
@@ -176,53 +410,93 @@ class GlobalTreasury:
             except Exception:
                 pass
 
-        for pat in [
-            r'"pair_id"\s*:\s*(\d{4,})',
-            r"'pair_id'\s*:\s*(\d{4,})",
-            r'data-pair-id=["\'](\d{4,})["\']',
-            r'var\s+pair_id\s*=\s*(\d{4,})',
-        ]:
-            m2 = re.search(pat, html)
+        for pat in _RE_PAIR_ID_FALLBACKS:
+            m2 = pat.search(html)
             if m2:
                 return int(m2.group(1))
         return None
 
     @staticmethod
-    def _search_in_json(obj: object, _depth: int = 0) -> int | None:
-        if _depth > 12:
-            return None
-        if isinstance(obj, dict):
-            for key in ("instrumentId", "pairId", "pair_id"):
-                val = obj.get(key)
-                if val is not None:
-                    try:
-                        v = int(val)
-                        if v > 1000:
-                            return v
-                    except (ValueError, TypeError):
-                        pass
-            for v in obj.values():
-                r = GlobalTreasury._search_in_json(v, _depth + 1)
-                if r:
-                    return r
-        elif isinstance(obj, list):
-            for item in obj[:30]:
-                r = GlobalTreasury._search_in_json(item, _depth + 1)
-                if r:
-                    return r
+    def _dig(obj: object, path: tuple[str, ...]) -> object | None:
+        """중첩 dict 에서 키 경로를 따라간 값. 중간에 dict 가 아니거나 키가 없으면 None."""
+        for key in path:
+            if not isinstance(obj, dict):
+                return None
+            obj = obj.get(key)
+        return obj
+
+    @staticmethod
+    def _search_in_json(obj: object, max_depth: int = 12) -> int | None:
+        """
+        JSON 트리에서 pair_id 후보 키(instrumentId / pairId / pair_id)를 깊이 우선 탐색.
+
+        재귀 대신 명시적 스택을 사용합니다. 자식을 역순으로 쌓아 재귀 버전과 같은
+        방문 순서(전위 순회)를 유지하고, 첫 유효값에서 바로 종료합니다.
+        """
+        stack: list[tuple[object, int]] = [(obj, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                continue
+            if isinstance(node, dict):
+                for key in ("instrumentId", "pairId", "pair_id"):
+                    val = node.get(key)
+                    if val is not None:
+                        try:
+                            v = int(val)
+                            if v > 1000:
+                                return v
+                        except (ValueError, TypeError):
+                            pass
+                children = list(node.values())
+            elif isinstance(node, list):
+                children = node[:30]
+            else:
+                continue
+            stack.extend((child, depth + 1) for child in reversed(children))
         return None
 
     # ── 시계열 조회 ───────────────────────────────────────────────────────────
 
-    def _fetch_history(self, pair_id: int, slug: str, start_date: str, end_date: str) -> pd.Series | None:
-        st = datetime.strptime(start_date, "%Y-%m-%d").strftime("%m/%d/%Y")
-        en = datetime.strptime(end_date,   "%Y-%m-%d").strftime("%m/%d/%Y")
+    def _fetch_history_cached(self, pair_id: int, slug: str, start_date: str, end_date: str) -> Hist | None:
+        """
+        만기별 누적 캐시(hist_{pair_id}.parquet)를 사용해 캐시가 덮지 못한 구간만 새로 조회합니다.
+
+        캐시 수집 구간(cov_start ~ cov_end)은 어제까지로만 기록해 오늘(장중일 수 있는) 값은 다음
+        실행에서 다시 받습니다. 요청 시작일이 캐시 구간 밖이면 전체 구간을 새로 받아 캐시를 교체합니다.
+        """
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        path      = self._hist_cache_path(pair_id)
+        cached    = self._read_hist_cache(path)
+        if cached is not None:
+            (dates, prices), cov_start, cov_end = cached
+            fetch_from = (date.fromisoformat(cov_end) + timedelta(days=1)).isoformat()
+        if cached is None or not (cov_start <= start_date <= fetch_from):
+            hist = self._fetch_history(pair_id, slug, start_date, end_date)
+            if hist is not None:
+                self._write_hist_cache(path, hist, start_date, min(end_date, yesterday))
+            return hist
+
+        if end_date >= fetch_from:
+            fresh = self._fetch_history(pair_id, slug, fetch_from, end_date)
+            if fresh is not None:
+                # 캐시 구간 이후(이전 실행의 오늘 값 포함)는 새 데이터로 교체
+                keep   = dates < np.datetime64(fetch_from)
+                dates  = np.concatenate([dates[keep], fresh[0]])
+                prices = np.concatenate([prices[keep], fresh[1]])
+                self._write_hist_cache(path, (dates, prices), cov_start, max(cov_end, min(end_date, yesterday)))
+
+        mask = (dates >= np.datetime64(start_date)) & (dates <= np.datetime64(end_date))
+        if not mask.any():
+            return None
+        return dates[mask], prices[mask]
 
+    def _fetch_history(self, pair_id: int, slug: str, start_date: str, end_date: str) -> Hist | None:
         form_data = {
             "curr_id":     str(pair_id),
             "smlID":       "",
-            "st_date":     st,
-            "end_date":    en,
+            "st_date":     _to_mdy(start_date),
+            "end_date":    _to_mdy(end_date),
             "interval_sec": "Daily",
             "sort_col":    "date",
             "sort_ord":    "ASC",
@@ -231,102 +505,179 @@ class GlobalTreasury:
         referer = f"{self.INVESTING_BASE}/{slug}-historical-data"
 
         try:
+            self._ensure_page(slug)
             # 브라우저 컨텍스트 내 fetch 실행 → Cloudflare 쿠키 자동 포함
-            html_text: str = self._page.evaluate(
-                """
-                async ([url, data, referer]) => {
-                    const resp = await fetch(url, {
-                        method: 'POST',
-                        headers: {
-                            'X-Requested-With': 'XMLHttpRequest',
-                            'Accept': 'text/plain, */*; q=0.01',
-                            'Content-Type': 'application/x-www-form-urlencoded',
-                            'Referer': referer,
-                        },
-                        body: new URLSearchParams(data).toString(),
-                    });
-                    return resp.text();
-                }
-                """,
-                [self.HIST_AJAX_URL, form_data, referer],
-            )
+            # 차단·속도 제한(403/429/503, 챌린지 페이지) 응답이면 늘어난 간격만큼 쉬고 최대 3회 시도
+            for _ in range(3):
+                self._pace()
+                resp = self._page.evaluate(
+                    """
+                    async ([url, data, referer]) => {
+                        const resp = await fetch(url, {
+                            method: 'POST',
+                            headers: {
+                                'X-Requested-With': 'XMLHttpRequest',
+                                'Accept': 'text/plain, */*; q=0.01',
+                                'Content-Type': 'application/x-www-form-urlencoded',
+                                'Referer': referer,
+                            },
+                            body: new URLSearchParams(data).toString(),
+                        });
+                        return {status: resp.status, text: await resp.text()};
+                    }
+                    """,
+                    [self.HIST_AJAX_URL, form_data, referer],
+                )
+                blocked = _RE_CHALLENGE.search(resp["text"] or "") is not None
+                if not self._note_status(resp["status"], blocked=blocked):
+                    break
+            html_text: str = resp["text"]
             if not html_text:
                 return None
-            dfs = pd.read_html(StringIO(html_text))
-            if not dfs:
-                return None
-            df = dfs[0]
-            if "Date" not in df.columns or "Price" not in df.columns:
-                return None
-            df["Date"]  = pd.to_datetime(df["Date"])
-            df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
-            df = df.dropna(subset=["Date", "Price"]).sort_values("Date", ascending=True)
-            return pd.Series(df["Price"].values, index=df["Date"].dt.date, dtype=float)
+            return self._parse_history_table(html_text)
         except Exception as e:
             print(f"    [경고] 데이터 조회 오류 (pair_id={pair_id}): {e}")
             return None
 
+    @staticmethod
+    def _parse_history_table(html_text: str) -> Hist | None:
+        """
+        HistoricalDataAjax 응답 HTML(Date | Price | Open | High | Low | Change % 테이블)을
+        lxml로 직접 파싱해 (날짜, Price) 배열로 변환합니다. 유효 행이 없으면 None.
+
+        pd.read_html 의 다중 테이블 탐지·타입 추론을 건너뛰고 첫 테이블의 셀 텍스트만 읽습니다.
+        """
+        tables = lxml.html.fromstring(html_text).xpath("//table")
+        if not tables:
+            return None
+        rows = tables[0].xpath(".//tr")
+        if not rows:
+            return None
+
+        header = [c.text_content().strip() for c in rows[0].xpath("./th|./td")]
+        if "Date" not in header or "Price" not in header:
+            return None
+        i_date, i_price = header.index("Date"), header.index("Price")
+        need = max(i_date, i_price)
+
+        cells  = [[td.text_content().strip() for td in r.xpath("./td")] for r in rows[1:]]
+        cells  = [c for c in cells if len(c) > need and c[i_price] not in ("", "-")]  # 빈 값·"-" 행 제외
+        if not cells:
+            return None
+        raw_dates = np.array([c[i_date] for c in cells])
+        # investing.com 날짜는 "Nov 12, 2024" 고정 형식 → 명시 format 으로 빠른 파싱, 형식이 바뀌면 추론 파싱
+        dates = pd.to_datetime(raw_dates, format="%b %d, %Y", errors="coerce")
+        if dates.isna().all():
+            dates = pd.to_datetime(raw_dates, errors="coerce")
+        dates = dates.to_numpy(dtype="datetime64[ns]")
+
+        # 천 단위 콤마 제거 후 한 번에 float 변환, "-" 등 비숫자가 섞였을 때만 coerce 경로
+        raw_price = np.char.replace(np.array([c[i_price] for c in cells]), ",", "")
+        try:
+            prices = raw_price.astype(np.float64)
+        except ValueError:
+            prices = pd.to_numeric(raw_price, errors="coerce").astype(float)
+
+        valid = ~np.isnat(dates) & ~np.isnan(prices)
+        if not valid.any():
+            return None
+        dates, prices = dates[valid], prices[valid]
+        if (np.diff(dates) < np.timedelta64(0)).any():  # 요청은 ASC 정렬 → 보통 정렬 생략
+            order = np.argsort(dates, kind="stable")
+            dates, prices = dates[order], prices[order]
+        return dates, prices
+
     # ── 공개 인터페이스 ───────────────────────────────────────────────────────
 
-    def collect(self, start_date: str, end_date: str) -> pd.DataFrame | None:
+    def _collect_one(self, col: str, slug: str, start_date: str, end_date: str) -> Hist | None:
+        """만기 하나(pair_id 조회 → 시계열 조회). 현재 브라우저 세션을 사용합니다."""
+        pair_id = self._get_pair_id(slug)
+        if pair_id is None:
+            print(f"    {col} → 건너뜀 (pair_id 없음)")
+            return None
+
+        hist = self._fetch_history_cached(pair_id, slug, start_date, end_date)
+        if hist is not None:
+            print(f"    {col} → {len(hist[0])}행 수집 완료")
+            return hist
+        print(f"    {col} → 데이터 없음")
+        return None
+
+    def _collect_country(
+        self, country: str, maturities: dict[int, str], start_date: str, end_date: str,
+    ) -> dict[str, Hist]:
+        """
+        한 국가의 만기들을 순차 수집합니다 (스레드당 독립 Playwright·Chromium 세션).
+
+        sync Playwright 객체는 스레드 간 공유할 수 없으므로 국가마다 작업용 인스턴스를
+        새로 만들고, pair_id 캐시만 공유합니다. 브라우저는 캐시 미스로 네트워크가
+        필요할 때 처음 실행됩니다.
+        """
+        worker = GlobalTreasury(pair_id_cache=self._pair_id_cache)
+        result: dict[str, Hist] = {}
+        try:
+            for tenor, slug in maturities.items():
+                col = f"{country}_{tenor}Y"
+                hist = worker._collect_one(col, slug, start_date, end_date)
+                if hist is not None:
+                    result[col] = hist
+        except Exception as e:
+            print(f"  [경고] {country} 수집 중단: {e}")
+        finally:
+            worker._stop_browser()
+        print(f"  [{country}] {len(result)}/{len(maturities)}개 만기 완료", flush=True)
+        return result
+
+    def collect(self, start_date: str, end_date: str, max_workers: int = 5) -> pd.DataFrame | None:
         """
         investing.com에서 글로벌 국채 금리 데이터를 수집합니다.
 
+        국가별로 독립 브라우저 세션을 띄워 최대 max_workers 개국을 동시에 수집합니다
+        (국가 내 만기는 순차, 세션당 최소 요청 간격 + 차단 응답 시 백오프). 컬럼 순서는 BOND_SLUGS 순서를 따릅니다.
+
         Args:
-            start_date: "YYYY-MM-DD" (포함)
-            end_date  : "YYYY-MM-DD" (포함)
+            start_date : "YYYY-MM-DD" (포함)
+            end_date   : "YYYY-MM-DD" (포함)
+            max_workers: 동시 수집 국가 수 (1이면 기존처럼 순차 수집)
 
         Returns:
             Date 인덱스, 컬럼명 "{CC}_{n}Y" 의 pd.DataFrame. 실패 시 None.
         """
-        all_series: dict[str, pd.Series] = {}
         total = sum(len(m) for m in self.BOND_SLUGS.values())
-        done  = 0
+        print(f"  {len(self.BOND_SLUGS)}개국 {total}개 만기 수집 (동시 {max_workers}개국)", flush=True)
 
-        self._start_browser()
-        try:
-            for country, maturities in self.BOND_SLUGS.items():
-                for tenor, slug in maturities.items():
-                    done += 1
-                    col = f"{country}_{tenor}Y"
-                    print(f"  [{done}/{total}] {col} 수집 중...", flush=True)
-
-                    pair_id = self._get_pair_id(slug)
-                    if pair_id is None:
-                        print(f"    → 건너뜀 (pair_id 없음)")
-                        time.sleep(0.3)
-                        continue
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as ex:
+            per_country = list(ex.map(
+                lambda item: self._collect_country(item[0], item[1], start_date, end_date),
+                self.BOND_SLUGS.items(),
+            ))
 
-                    time.sleep(0.5)
-                    series = self._fetch_history(pair_id, slug, start_date, end_date)
-                    if series is not None and not series.empty:
-                        all_series[col] = series
-                        print(f"    → {len(series)}행 수집 완료")
-                    else:
-                        print(f"    → 데이터 없음")
-                    time.sleep(0.5)
-        finally:
-            self._stop_browser()
+        raw: dict[str, Hist] = {}
+        for hist_map in per_country:
+            raw.update(hist_map)
 
-        if not all_series:
+        if not raw:
             print("  [오류] 수집된 데이터 없음")
             return None
 
-        df = pd.DataFrame(all_series)
-        df.index.name = "Date"
-        df = df.sort_index()
+        # 날짜 합집합을 한 번 만들고, 컬럼마다 searchsorted 위치에 바로 기록 (Series 정렬 없음)
+        cols      = list(raw)
+        all_dates = np.unique(np.concatenate([d for d, _ in raw.values()]))
+        data      = np.full((len(all_dates), len(cols)), np.nan)
+        for j, c in enumerate(cols):
+            dates, prices = raw[c]
+            data[np.searchsorted(all_dates, dates), j] = prices
+        df = pd.DataFrame(data, index=pd.DatetimeIndex(all_dates, name="Date"), columns=cols)
 
         missing = [c for c in df.columns if df[c].isna().all()]
         if missing:
             print(f"  [경고] 전체 NaN 컬럼 (미지원): {missing}")
 
         print(f"  기간: {start_date} ~ {end_date}  |  {len(df)}행 {len(df.columns)}열")
-        return TreasuryCalc.fill_calendar(df)
+        return TreasuryCalc.fill_calendar(df, assume_sorted=True)  # np.unique → 정렬·중복 없음
 
 
 if __name__ == "__main__":
-    from datetime import date, timedelta
-
     _end   = date.today() - timedelta(days=1)
     _start = _end - timedelta(days=365)
 
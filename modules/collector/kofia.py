@@ -20,6 +20,8 @@ import time
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 _root = Path(__file__).resolve().parents[2]
 if str(_root) not in sys.path:
@@ -102,13 +104,18 @@ def _set_date_range(driver, wait, start_str: str, end_str: str):
     time.sleep(1)
 
 
-def _wait_for_download(save_dir: str, cwd: str, timeout: int = 30, filename: str = _KOFIA_DL_FILE) -> str | None:
+def _wait_for_download(save_dir: str, cwd: str | None, timeout: int = 30, filename: str = _KOFIA_DL_FILE) -> str | None:
+    """
+    save_dir 에 다운로드 파일이 생길 때까지 대기합니다.
+
+    cwd 가 주어지면 cwd, cwd/data 도 함께 확인합니다 (다운로드 경로 설정이 무시된 경우 대비).
+    배치를 동시에 수집할 때는 None 으로 넘겨 다른 배치의 같은 이름 파일을 집어 오지 않게 합니다.
+    """
+    candidates = [os.path.join(save_dir, filename)]
+    if cwd is not None:
+        candidates += [os.path.join(cwd, filename), os.path.join(cwd, "data", filename)]
     for _ in range(timeout):
-        for p in [
-            os.path.join(save_dir, filename),
-            os.path.join(cwd, filename),
-            os.path.join(cwd, "data", filename),
-        ]:
+        for p in candidates:
             if os.path.exists(p):
                 return p
         time.sleep(1)
@@ -144,6 +151,18 @@ def _parse_kofia_xls(file_path: str) -> pd.DataFrame | None:
         return None
 
 
+def _run_batches(collect_one, batches: list[dict], max_workers: int) -> list[tuple[str, str]]:
+    """
+    배치 수집 함수를 최대 max_workers 개의 Chrome 세션으로 동시에 실행합니다.
+
+    각 배치는 독립 세션·독립 다운로드 폴더를 쓰므로 서로 간섭하지 않습니다.
+    반환: 성공한 배치의 (배치명, 파일 경로) 목록 — 배치 정의 순서 유지.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as ex:
+        results = list(ex.map(collect_one, batches))
+    return [r for r in results if r is not None]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Class 1: TreasurySummary
 # ══════════════════════════════════════════════════════════════════════════════
@@ -303,7 +322,80 @@ class BondSummary:
         self._tmp_dir = os.path.join(self.download_dir, "tmp")
         os.makedirs(self._tmp_dir, exist_ok=True)
 
-    def collect(self, start_date: str, end_date: str, headless: bool = True) -> pd.DataFrame | None:
+    def _collect_batch(
+        self, batch: dict, chromedriver_path: str, start_date: str, end_date: str, headless: bool,
+        parallel: bool = False,
+    ) -> tuple[str, str] | None:
+        """
+        배치 하나를 독립 Chrome 세션·독립 다운로드 폴더로 수집합니다. 반환: (배치명, 파일 경로).
+
+        parallel 이면 다운로드 파일을 배치 폴더에서만 찾습니다 (공유 cwd 폴백 미사용).
+        """
+        bname = batch["name"]
+        bids  = batch["ids"]
+        print(f"  [배치 {bname}] 수집 시작...")
+
+        # 배치를 동시에 실행해도 같은 이름의 다운로드 파일이 섞이지 않도록 배치별 폴더 사용
+        batch_dir = os.path.join(self._tmp_dir, f"bond_summary_{bname}")
+        os.makedirs(batch_dir, exist_ok=True)
+
+        driver = webdriver.Chrome(
+            service=Service(chromedriver_path),
+            options=_build_options(headless, batch_dir),
+        )
+        wait = WebDriverWait(driver, 30)
+
+        try:
+            _navigate_to_period_tab(driver, wait)
+            _set_date_range(driver, wait, start_date, end_date)
+
+            # 페이지 기본 체크 항목 해제 (신규 세션이므로 항상 알려진 초기 상태)
+            for cid in _BOND_SUMMARY_INIT_UNCHECK:
+                _force_click_checkbox(driver, cid)
+            time.sleep(0.3)
+
+            # 이 배치만 체크
+            for cid in bids:
+                _force_click_checkbox(driver, cid)
+            time.sleep(0.5)
+
+            _safe_click(driver, wait, By.ID, "image4")
+            time.sleep(5)
+            _safe_click(driver, wait, By.ID, "imgExcel")
+            time.sleep(5)
+
+            dl = _wait_for_download(batch_dir, None if parallel else os.getcwd())
+            if dl:
+                dest = os.path.join(self._tmp_dir, f"bond_summary_{bname}.xls")
+                if os.path.exists(dest):
+                    os.remove(dest)
+                os.rename(dl, dest)
+                print(f"  [배치 {bname}] 완료 → {os.path.basename(dest)}")
+                return bname, dest
+            print(f"  [배치 {bname}] 다운로드 실패 — 건너뜀")
+            return None
+
+        except Exception as e:
+            print(f"  [배치 {bname}] Selenium 오류: {e}")
+            try:
+                with open(
+                    os.path.join(self.download_dir, f"selenium_error_bond_{bname}.html"),
+                    "w", encoding="utf-8",
+                ) as f:
+                    f.write(driver.page_source)
+            except Exception:
+                pass
+            return None
+        finally:
+            driver.quit()
+            try:
+                os.rmdir(batch_dir)  # 비어 있을 때만 삭제됨
+            except OSError:
+                pass
+
+    def collect(
+        self, start_date: str, end_date: str, headless: bool = True, max_workers: int = 3,
+    ) -> pd.DataFrame | None:
         """
         배치(A/B/C)마다 독립 Chrome 세션으로 수집 후 병합하여 반환합니다.
 
@@ -311,11 +403,13 @@ class BondSummary:
           - 엑셀 다운로드 후 WebSquare가 내부 상태를 리셋할 수 있어,
             단일 세션에서 배치 간 체크박스 상태가 오염될 수 있음
           - 독립 세션은 항상 알려진 초기 상태(기본 체크 항목 고정)에서 시작
+        세션이 서로 독립이므로 배치들은 최대 max_workers 개까지 동시에 수집됩니다.
 
         Args:
-            start_date: "YYYY-MM-DD"
-            end_date  : "YYYY-MM-DD"
-            headless  : True이면 브라우저 창 없이 실행
+            start_date : "YYYY-MM-DD"
+            end_date   : "YYYY-MM-DD"
+            headless   : True이면 브라우저 창 없이 실행
+            max_workers: 동시에 띄울 Chrome 세션 수 (1이면 순차 수집)
 
         Returns:
             Date 컬럼을 포함한 병합 DataFrame. 실패 시 None.
@@ -323,61 +417,13 @@ class BondSummary:
         print(f"  기간: {start_date} ~ {end_date}")
 
         chromedriver_path = ChromeDriverManager().install()
-        batch_files: list[tuple[str, str]] = []
-
-        for batch in _BOND_SUMMARY_BATCHES:
-            bname = batch["name"]
-            bids  = batch["ids"]
-            print(f"  [배치 {bname}] 수집 시작...")
-
-            driver = webdriver.Chrome(
-                service=Service(chromedriver_path),
-                options=_build_options(headless, self._tmp_dir),
-            )
-            wait = WebDriverWait(driver, 30)
-
-            try:
-                _navigate_to_period_tab(driver, wait)
-                _set_date_range(driver, wait, start_date, end_date)
-
-                # 페이지 기본 체크 항목 해제 (신규 세션이므로 항상 알려진 초기 상태)
-                for cid in _BOND_SUMMARY_INIT_UNCHECK:
-                    _force_click_checkbox(driver, cid)
-                time.sleep(0.3)
-
-                # 이 배치만 체크
-                for cid in bids:
-                    _force_click_checkbox(driver, cid)
-                time.sleep(0.5)
-
-                _safe_click(driver, wait, By.ID, "image4")
-                time.sleep(5)
-                _safe_click(driver, wait, By.ID, "imgExcel")
-                time.sleep(5)
-
-                dl = _wait_for_download(self._tmp_dir, os.getcwd())
-                if dl:
-                    dest = os.path.join(self._tmp_dir, f"bond_summary_{bname}.xls")
-                    if os.path.exists(dest):
-                        os.remove(dest)
-                    os.rename(dl, dest)
-                    batch_files.append((bname, dest))
-                    print(f"  [배치 {bname}] 완료 → {os.path.basename(dest)}")
-                else:
-                    print(f"  [배치 {bname}] 다운로드 실패 — 건너뜀")
-
-            except Exception as e:
-                print(f"  [배치 {bname}] Selenium 오류: {e}")
-                try:
-                    with open(
-                        os.path.join(self.download_dir, f"selenium_error_bond_{bname}.html"),
-                        "w", encoding="utf-8",
-                    ) as f:
-                        f.write(driver.page_source)
-                except Exception:
-                    pass
-            finally:
-                driver.quit()
+        collect_one = partial(
+            self._collect_batch,
+            chromedriver_path=chromedriver_path,
+            start_date=start_date, end_date=end_date, headless=headless,
+            parallel=max_workers > 1,
+        )
+        batch_files = _run_batches(collect_one, _BOND_SUMMARY_BATCHES, max_workers)
 
         if not batch_files:
             print("  [실패] 다운로드된 파일 없음")
@@ -512,14 +558,89 @@ class BondSummary_OTC:
         self._tmp_dir = os.path.join(self.download_dir, "tmp")
         os.makedirs(self._tmp_dir, exist_ok=True)
 
-    def collect(self, start_date: str, end_date: str, headless: bool = True) -> pd.DataFrame | None:
+    def _collect_batch(
+        self, batch: dict, chromedriver_path: str, start_date: str, end_date: str, headless: bool,
+        parallel: bool = False,
+    ) -> tuple[str, str] | None:
+        """
+        배치 하나를 독립 Chrome 세션·독립 다운로드 폴더로 수집합니다. 반환: (배치명, 파일 경로).
+
+        parallel 이면 다운로드 파일을 배치 폴더에서만 찾습니다 (공유 cwd 폴백 미사용).
+        """
+        bname = batch["name"]
+        bids  = batch["ids"]
+        print(f"  [배치 {bname}] 수집 시작...")
+
+        # 배치를 동시에 실행해도 같은 이름의 다운로드 파일이 섞이지 않도록 배치별 폴더 사용
+        batch_dir = os.path.join(self._tmp_dir, f"otc_summary_{bname}")
+        os.makedirs(batch_dir, exist_ok=True)
+
+        driver = webdriver.Chrome(
+            service=Service(chromedriver_path),
+            options=_build_options(headless, batch_dir),
+        )
+        wait = WebDriverWait(driver, 30)
+
+        try:
+            _navigate_to_otc_page(driver, wait)
+            _set_date_range(driver, wait, start_date, end_date)
+
+            # 페이지 기본 체크 항목 해제 (신규 세션이므로 항상 알려진 초기 상태)
+            for cid in _OTC_INIT_UNCHECK:
+                _force_click_checkbox(driver, cid)
+            time.sleep(0.3)
+
+            # 이 배치만 체크
+            for cid in bids:
+                _force_click_checkbox(driver, cid)
+            time.sleep(0.5)
+
+            _safe_click(driver, wait, By.ID, "image8")
+            time.sleep(5)
+            _safe_click(driver, wait, By.ID, "imgExcel")
+            time.sleep(5)
+
+            dl = _wait_for_download(batch_dir, None if parallel else os.getcwd(), filename=_OTC_DL_FILE)
+            if dl:
+                dest = os.path.join(self._tmp_dir, f"otc_summary_{bname}.xls")
+                if os.path.exists(dest):
+                    os.remove(dest)
+                os.rename(dl, dest)
+                print(f"  [배치 {bname}] 완료 → {os.path.basename(dest)}")
+                return bname, dest
+            print(f"  [배치 {bname}] 다운로드 실패 — 건너뜀")
+            return None
+
+        except Exception as e:
+            print(f"  [배치 {bname}] Selenium 오류: {e}")
+            try:
+                with open(
+                    os.path.join(self.download_dir, f"selenium_error_otc_{bname}.html"),
+                    "w", encoding="utf-8",
+                ) as f:
+                    f.write(driver.page_source)
+            except Exception:
+                pass
+            return None
+        finally:
+            driver.quit()
+            try:
+                os.rmdir(batch_dir)  # 비어 있을 때만 삭제됨
+            except OSError:
+                pass
+
+    def collect(
+        self, start_date: str, end_date: str, headless: bool = True, max_workers: int = 3,
+    ) -> pd.DataFrame | None:
         """
         배치(A/B/C)마다 독립 Chrome 세션으로 수집 후 병합하여 반환합니다.
+        배치들은 최대 max_workers 개까지 동시에 수집됩니다.
 
         Args:
-            start_date: "YYYY-MM-DD"
-            end_date  : "YYYY-MM-DD"
-            headless  : True이면 브라우저 창 없이 실행
+            start_date : "YYYY-MM-DD"
+            end_date   : "YYYY-MM-DD"
+            headless   : True이면 브라우저 창 없이 실행
+            max_workers: 동시에 띄울 Chrome 세션 수 (1이면 순차 수집)
 
         Returns:
             Date 컬럼을 포함한 병합 DataFrame. 실패 시 None.
@@ -527,59 +648,13 @@ class BondSummary_OTC:
         print(f"  기간: {start_date} ~ {end_date}")
 
         chromedriver_path = ChromeDriverManager().install()
-        batch_files: list[tuple[str, str]] = []
-
-        for batch in _OTC_BATCHES:
-            bname = batch["name"]
-            bids  = batch["ids"]
-            print(f"  [배치 {bname}] 수집 시작...")
-
-            driver = webdriver.Chrome(
-                service=Service(chromedriver_path),
-                options=_build_options(headless, self._tmp_dir),
-            )
-            wait = WebDriverWait(driver, 30)
-
-            try:
-                _navigate_to_otc_page(driver, wait)
-                _set_date_range(driver, wait, start_date, end_date)
-
-                for cid in _OTC_INIT_UNCHECK:
-                    _force_click_checkbox(driver, cid)
-                time.sleep(0.3)
-
-                for cid in bids:
-                    _force_click_checkbox(driver, cid)
-                time.sleep(0.5)
-
-                _safe_click(driver, wait, By.ID, "image8")
-                time.sleep(5)
-                _safe_click(driver, wait, By.ID, "imgExcel")
-                time.sleep(5)
-
-                dl = _wait_for_download(self._tmp_dir, os.getcwd(), filename=_OTC_DL_FILE)
-                if dl:
-                    dest = os.path.join(self._tmp_dir, f"otc_summary_{bname}.xls")
-                    if os.path.exists(dest):
-                        os.remove(dest)
-                    os.rename(dl, dest)
-                    batch_files.append((bname, dest))
-                    print(f"  [배치 {bname}] 완료 → {os.path.basename(dest)}")
-                else:
-                    print(f"  [배치 {bname}] 다운로드 실패 — 건너뜀")
-
-            except Exception as e:
-                print(f"  [배치 {bname}] Selenium 오류: {e}")
-                try:
-                    with open(
-                        os.path.join(self.download_dir, f"selenium_error_otc_{bname}.html"),
-                        "w", encoding="utf-8",
-                    ) as f:
-                        f.write(driver.page_source)
-                except Exception:
-                    pass
-            finally:
-                driver.quit()
+        collect_one = partial(
+            self._collect_batch,
+            chromedriver_path=chromedriver_path,
+            start_date=start_date, end_date=end_date, headless=headless,
+            parallel=max_workers > 1,
+        )
+        batch_files = _run_batches(collect_one, _OTC_BATCHES, max_workers)
 
         if not batch_files:
             print("  [실패] 다운로드된 파일 없음")